@@ -4,19 +4,66 @@ Nomos is an open-source, configurable multi-step agent framework for building ad
 Define your agent's persona, tools, and step-by-step flows in Python or YAML—perfect for conversational, workflow, and automation use cases.
 """
 
-from .client import AuthConfig, NomosClient, NomosClientSync
-from .config import AgentConfig, ServerConfig
-from .core import Agent
-from .models.agent import Action, Route, State, Step, StepIdentifier, Summary
-from .models.flow import Flow, FlowComponent, FlowConfig, FlowContext, FlowManager
-from .server import run_server
-from .state_machine import StateMachine
-from .testing import smart_assert
-from .testing.e2e import Scenario, ScenarioRunner
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.3.7"
 __author__ = "DoWhile"
 
+if TYPE_CHECKING:
+    from .client import AuthConfig, NomosClient, NomosClientSync
+    from .config import AgentConfig, ServerConfig
+    from .core import Agent
+    from .models.agent import Action, Route, State, Step, StepIdentifier, Summary
+    from .models.flow import Flow, FlowComponent, FlowConfig, FlowContext, FlowManager
+    from .server import run_server
+    from .state_machine import StateMachine
+    from .testing import smart_assert
+    from .testing.e2e import Scenario, ScenarioRunner
+
+# Public names are resolved on first access so that light-weight consumers
+# (e.g. ``nomos --version``) do not pay for importing the whole agent stack.
+_LAZY_IMPORTS = {
+    "Agent": ".core",
+    "AgentConfig": ".config",
+    "ServerConfig": ".config",
+    "Action": ".models.agent",
+    "Step": ".models.agent",
+    "StepIdentifier": ".models.agent",
+    "Summary": ".models.agent",
+    "Route": ".models.agent",
+    "State": ".models.agent",
+    "Flow": ".models.flow",
+    "FlowManager": ".models.flow",
+    "FlowContext": ".models.flow",
+    "FlowComponent": ".models.flow",
+    "FlowConfig": ".models.flow",
+    "run_server": ".server",
+    "smart_assert": ".testing",
+    "ScenarioRunner": ".testing.e2e",
+    "Scenario": ".testing.e2e",
+    "StateMachine": ".state_machine",
+    "NomosClient": ".client",
+    "NomosClientSync": ".client",
+    "AuthConfig": ".client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazily imported names in ``dir(nomos)``."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     "Agent",
     "AgentConfig",
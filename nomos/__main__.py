@@ -0,0 +1,20 @@
+"""Entry point for the ``nomos`` console script and ``python -m nomos``."""
+
+import sys
+
+
+def main() -> None:
+    """Run the Nomos CLI, answering ``--version`` before Typer is imported."""
+    if len(sys.argv) >= 2 and sys.argv[1] in ("-v", "--version"):
+        from . import __version__
+
+        print(__version__)
+        sys.exit(0)
+
+    from .cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""Nomos CLI subcommands, one module per command.
+
+Each module exposes a single-command ``cmd`` Typer app and is imported by
+:class:`nomos.cli.LazyTyperGroup` only when that command is invoked.
+"""
+
+CONFIG_HELP = "Path to agent configuration file"
+TOOLS_HELP = "Python files containing tool definitions (can be used multiple times)"
@@ -0,0 +1,44 @@
+"""The ``nomos init`` command."""
+
+from typing import Optional
+
+import typer
+
+cmd = typer.Typer()
+
+
+@cmd.command()
+def init(
+    directory: Optional[str] = typer.Option(
+        None, "--directory", "-d", help="Directory to create the agent project in"
+    ),
+    name: Optional[str] = typer.Option(None, "--name", "-n", help="Name of the agent"),
+    template: Optional[str] = typer.Option(
+        None,
+        "--template",
+        "-t",
+        help="Template to use (basic, conversational, workflow)",
+    ),
+    generate: bool = typer.Option(
+        False, "--generate", "-g", help="Generate agent configuration using AI"
+    ),
+    usecase: Optional[str] = typer.Option(
+        None, "--usecase", "-u", help="Use case description or path to text file"
+    ),
+    tools: Optional[str] = typer.Option(
+        None, "--tools", help="Comma-separated list of available tools"
+    ),
+) -> None:
+    r"""Initialize a new Nomos agent project interactively.
+
+    Examples:\n
+    # Traditional interactive setup\n
+    nomos init\n
+    # AI-powered generation from use case\n
+    nomos init --generate --usecase "Create a weather agent" --tools "weather_api, calculator"\n
+    # Load use case from file\n
+    nomos init --generate --usecase "./my_usecase.txt"
+    """
+    from .._cli_impl import init_command
+
+    init_command(directory, name, template, generate, usecase, tools)
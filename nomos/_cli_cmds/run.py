@@ -0,0 +1,21 @@
+"""The ``nomos run`` command."""
+
+from typing import List, Optional
+
+import typer
+
+from . import CONFIG_HELP, TOOLS_HELP
+
+cmd = typer.Typer()
+
+
+@cmd.command()
+def run(
+    config: Optional[str] = typer.Option("config.agent.yaml", "--config", "-c", help=CONFIG_HELP),
+    tools: Optional[List[str]] = typer.Option(None, "--tools", "-t", help=TOOLS_HELP),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"),
+) -> None:
+    """Run the Nomos agent in development mode."""
+    from .._cli_impl import run_command
+
+    run_command(config, tools, verbose)
@@ -0,0 +1,22 @@
+"""The ``nomos schema`` command."""
+
+from typing import Optional
+
+import typer
+
+cmd = typer.Typer()
+
+
+@cmd.command()
+def schema(
+    output: Optional[str] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write JSON schema to file instead of stdout",
+    ),
+) -> None:
+    """Generate JSON schema for agent configuration."""
+    from .._cli_impl import schema_command
+
+    schema_command(output)
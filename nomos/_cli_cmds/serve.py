@@ -0,0 +1,24 @@
+"""The ``nomos serve`` command."""
+
+from typing import List, Optional
+
+import typer
+
+from . import CONFIG_HELP, TOOLS_HELP
+
+cmd = typer.Typer()
+
+
+@cmd.command()
+def serve(
+    config: Optional[str] = typer.Option("config.agent.yaml", "--config", "-c", help=CONFIG_HELP),
+    tools: Optional[List[str]] = typer.Option(None, "--tools", "-t", help=TOOLS_HELP),
+    port: Optional[int] = typer.Option(None, "--port", "-p", help="Port to bind the server"),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Number of uvicorn workers"
+    ),
+) -> None:
+    """Serve the Nomos agent using FastAPI and Uvicorn."""
+    from .._cli_impl import serve_command
+
+    serve_command(config, tools, port, workers)
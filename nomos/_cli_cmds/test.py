@@ -0,0 +1,26 @@
+"""The ``nomos test`` command."""
+
+from typing import List, Optional
+
+import typer
+
+cmd = typer.Typer()
+
+
+@cmd.command()
+def test(
+    config: Optional[str] = typer.Option(
+        None,
+        "--config",
+        "-c",
+        help="Path to YAML test configuration file (defaults to tests.agent.yaml)",
+    ),
+    coverage: bool = typer.Option(
+        True, "--coverage/--no-coverage", help="Generate coverage report"
+    ),
+    pytest_args: List[str] = typer.Argument(None),
+) -> None:
+    """Run the Nomos testing framework."""
+    from .._cli_impl import test_command
+
+    test_command(config, coverage, pytest_args)
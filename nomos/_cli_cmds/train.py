@@ -0,0 +1,20 @@
+"""The ``nomos train`` command."""
+
+from typing import List, Optional
+
+import typer
+
+from . import CONFIG_HELP, TOOLS_HELP
+
+cmd = typer.Typer()
+
+
+@cmd.command()
+def train(
+    config: Optional[str] = typer.Option("config.agent.yaml", "--config", "-c", help=CONFIG_HELP),
+    tools: Optional[List[str]] = typer.Option(None, "--tools", "-t", help=TOOLS_HELP),
+) -> None:
+    """Run the Nomos agent in training mode."""
+    from .._cli_impl import train_command
+
+    train_command(config, tools)
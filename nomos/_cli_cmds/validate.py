@@ -0,0 +1,18 @@
+"""The ``nomos validate`` command."""
+
+import typer
+
+cmd = typer.Typer()
+
+
+@cmd.command()
+def validate(
+    config: str = typer.Argument(..., help="Path to agent configuration YAML file to validate"),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Show detailed validation information"
+    ),
+) -> None:
+    """Validate agent configuration YAML file."""
+    from .._cli_impl import validate_command
+
+    validate_command(config, verbose)
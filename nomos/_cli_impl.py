@@ -0,0 +1,832 @@
+"""Implementation of the Nomos CLI commands.
+
+The command declarations live in :mod:`nomos._cli_cmds`; this module is only imported once
+a command actually runs so that ``nomos --help`` and ``nomos --version`` stay fast.
+"""
+
+import functools
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, Iterable, List, Optional, Set
+
+import typer
+
+from .constants import (
+    ERROR_COLOR,
+    LLM_CHOICE_INDEX_STRS,
+    LLM_CHOICE_NAMES,
+    LLM_CHOICES,
+    PRIMARY_COLOR,
+    SUCCESS_COLOR,
+    TEMPLATES,
+    WARNING_COLOR,
+)
+
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+
+    from .models.agent import Step
+    from .utils.generator import AgentConfiguration
+
+
+@functools.cache
+def _console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+banner_text = r"""
+ __  _  __  __ __  __    __
+|  \| |/__\|  V  |/__\ /' _/
+| | ' | \/ | \_/ | \/ |`._`.
+|_|\__|\__/|_| |_|\__/ |___/
+
+Build Agents you can audit.
+"""
+
+_NEXT_STEPS_TMPL: Final = """[bold cyan]1. Navigate to your project:[/bold cyan]
+   [bold]cd {target_dir}[/bold]
+
+[bold cyan]2. Edit configuration:[/bold cyan]
+   [bold]config.agent.yaml[/bold]
+
+[bold cyan]3. Add tools:[/bold cyan]
+   [bold]tools/[/bold] directory
+
+[bold cyan]4. Run development mode:[/bold cyan]
+   [bold]nomos run[/bold]
+
+[bold cyan]5. Serve your agent:[/bold cyan]
+   [bold]nomos serve[/bold]"""
+
+_TEMPLATE_NAMES: Final = tuple(TEMPLATES)
+
+
+@functools.cache
+def _banner_renderable() -> "RenderableType":
+    """Build the banner once, with a blank line above and below it."""
+    from rich.padding import Padding
+    from rich.panel import Panel
+    from rich.text import Text
+
+    banner = Panel(
+        Text.from_markup(banner_text.strip(), justify="center"),
+        border_style=PRIMARY_COLOR,
+        title_align="left",
+        padding=(1, 2),
+        expand=False,
+    )
+    return Padding(banner, (1, 0), expand=False)
+
+
+def _is_interactive() -> bool:
+    """Whether decorative output should be shown (a terminal, and ``NOMOS_QUIET`` unset)."""
+    return sys.stdout.isatty() and not os.environ.get("NOMOS_QUIET")
+
+
+def print_banner() -> None:
+    """Print the Nomos banner (interactive terminals only)."""
+    if _is_interactive():
+        _console().print(_banner_renderable())
+
+
+def _print_panel(content: str, **panel_kwargs: Any) -> None:
+    """
+    Print ``content`` in a Rich panel, or as plain lines when not interactive.
+
+    :param content: Panel body (Rich markup allowed).
+    :param panel_kwargs: Extra ``Panel`` arguments such as ``title`` and ``border_style``.
+    """
+    console = _console()
+    if not _is_interactive():
+        if panel_kwargs.get("title"):
+            console.print(panel_kwargs["title"])
+        console.print(content)
+        return
+
+    from rich.panel import Panel
+
+    console.print(Panel(content, padding=(1, 2), expand=False, **panel_kwargs))
+
+
+def init_command(
+    directory: Optional[str],
+    name: Optional[str],
+    template: Optional[str],
+    generate: bool,
+    usecase: Optional[str],
+    tools: Optional[str],
+) -> None:
+    """Initialize a new Nomos agent project interactively."""
+    from rich.prompt import Confirm, Prompt
+    from rich.table import Table
+
+    console = _console()
+    print_banner()
+
+    _print_panel(
+        "Welcome to Nomos! Let's create your new agent project.",
+        title="Project Initialization",
+        border_style=PRIMARY_COLOR,
+        title_align="left",
+    )
+
+    # Get target directory
+    if not directory:
+        directory = Prompt.ask(
+            "[bold cyan]Project directory[/bold cyan]", default="./my-nomos-agent"
+        )
+
+    target_dir = Path(directory).resolve()  # type: ignore
+
+    if target_dir.exists() and any(target_dir.iterdir()):  # noqa
+        if not Confirm.ask(
+            f"Directory [bold]{target_dir}[/bold] already exists and is not empty. Continue?"
+        ):
+            console.print("[red]ERROR:[/red] Project initialization cancelled.", style=ERROR_COLOR)
+            raise typer.Exit(1)
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    name = None
+    persona = None
+    steps: List[Step] = []
+
+    # Choose LLM provider
+    llm_table = Table(title="Choose LLM Provider")
+    llm_table.add_column("Option", style=PRIMARY_COLOR)
+    llm_table.add_column("Provider")
+
+    for index, choice in zip(LLM_CHOICE_INDEX_STRS, LLM_CHOICE_NAMES):
+        llm_table.add_row(index, choice)
+
+    console.print(llm_table)
+
+    llm_choice = _prompt_llm_choice()
+    llm_meta = LLM_CHOICES[llm_choice]
+
+    if not generate and not template:
+        generate = Confirm.ask(
+            "[bold green]Would you like to generate the agent configuration using AI?[/bold green]",
+            default=False,
+        )
+
+    if not generate and not template:
+        template = Prompt.ask(
+            "Please select a template for your agent",
+            choices=list(_TEMPLATE_NAMES),
+            default="basic",
+        )
+
+    if template:
+        # Load template configuration
+        template_config = TEMPLATES.get(template)
+        if not template_config:
+            console.print(
+                f"[red]ERROR:[/red] Template '{template}' not found. Available templates: {', '.join(_TEMPLATE_NAMES)}",
+                style=ERROR_COLOR,
+            )
+            raise typer.Exit(1)
+        name = template_config.get("name", "my_nomos_agent")  # type: ignore
+        persona = template_config.get("persona", "A Nomos agent")  # type: ignore
+        steps = template_config.get("steps", [])  # type: ignore
+
+    if generate:
+        # Generation uses the provider chosen above; only the model is asked for.
+        _provider = llm_meta["provider"]
+        _model = Prompt.ask(
+            "Mention the model you would like to use for generation",
+            default=llm_meta["model"],
+        )
+        usecase = Prompt.ask(
+            "Please provide a use case description or path to a text file containing the use case",
+            default="Create a weather agent",
+        )
+        tools = Prompt.ask(
+            "Mention the tools available for the agent (comma-separated, e.g. weather_api, calculator)",
+            default=None,
+        )
+        try:
+            generated_config = _handle_config_generation(
+                usecase=usecase,
+                provider=_provider,
+                model=_model,
+                tools=tools,  # type: ignore
+            )
+            steps = generated_config.to_agent_steps()
+            name = generated_config.name
+            persona = generated_config.persona
+        except Exception as e:
+            console.print(
+                f"[red]ERROR:[/red] Failed to generate agent configuration: {e}.",
+                style=ERROR_COLOR,
+            )
+
+    # Generate project files
+    _generate_project_files(target_dir, name, persona, llm_choice, steps)  # type: ignore
+
+    _print_panel(
+        f"[bold green]SUCCESS:[/bold green] Project created successfully in [bold]{target_dir}[/bold]",
+        border_style=SUCCESS_COLOR,
+    )
+
+    _print_panel(
+        _NEXT_STEPS_TMPL.format(target_dir=target_dir),
+        title="[bold]Next Steps[/bold]",
+        border_style=PRIMARY_COLOR,
+    )
+
+
+def _resolve_tool_paths(tools: Optional[List[str]]) -> List[Path]:
+    """Convert ``--tools`` arguments to paths, exiting if any of them is missing."""
+    if not tools:
+        return []
+    paths = [Path(tool) for tool in tools]
+    missing = [path for path in paths if not path.exists()]
+    if missing:
+        console = _console()
+        for path in missing:
+            console.print(
+                f"[red]ERROR:[/red] Tool file not found: [bold]{path}[/bold]",
+                style=ERROR_COLOR,
+            )
+        raise typer.Exit(1)
+    return paths
+
+
+def _set_tools_env(tool_paths: Iterable[Path], include_default: bool = True) -> Set[str]:
+    """
+    Point ``TOOLS_PATH`` at the directories containing the given tool files.
+
+    :param tool_paths: Tool files or directories passed on the command line.
+    :param include_default: Also use ``./tools`` when it exists.
+    :return: The tool directories, empty if there are none.
+    """
+    tool_dirs = {str(p if p.is_dir() else p.parent) for p in tool_paths}
+    default_tool_dir = Path.cwd() / "tools"
+    if include_default and default_tool_dir.exists():
+        tool_dirs.add(str(default_tool_dir))
+
+    if tool_dirs:
+        os.environ["TOOLS_PATH"] = os.pathsep.join(tool_dirs)
+    return tool_dirs
+
+
+def _prompt_llm_choice() -> str:
+    """Ask the user to pick an LLM provider and return its name."""
+    from rich.prompt import Prompt
+
+    llm_choice_idx = Prompt.ask(
+        "[bold blue]Select LLM provider[/bold blue]",
+        choices=list(LLM_CHOICE_INDEX_STRS),
+        default="1",
+    )
+    return LLM_CHOICE_NAMES[int(llm_choice_idx) - 1]
+
+
+def run_command(config: Optional[str], tools: Optional[List[str]], verbose: bool) -> None:
+    """Run the Nomos agent in development mode."""
+    console = _console()
+    print_banner()
+
+    config_path = Path(config)  # type: ignore
+
+    # Validate config file exists
+    if not config_path.exists():
+        console.print(
+            f"[red]ERROR:[/red] Configuration file not found: [bold]{config_path}[/bold]",
+            style=ERROR_COLOR,
+        )
+        raise typer.Exit(1)
+
+    tool_paths = _resolve_tool_paths(tools)
+
+    try:
+        _run(config_path, tool_paths, verbose)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Development Run stopped.[/yellow]", style=WARNING_COLOR)
+    except Exception as e:
+        console.print(f"[red]ERROR:[/red] Error running development Run: {e}", style=ERROR_COLOR)
+        raise typer.Exit(1)
+
+
+def train_command(config: Optional[str], tools: Optional[List[str]]) -> None:
+    """Run the Nomos agent in training mode."""
+    console = _console()
+    print_banner()
+
+    config_path = Path(config)  # type: ignore
+
+    if not config_path.exists():
+        console.print(
+            f"[red]ERROR:[/red] Configuration file not found: [bold]{config_path}[/bold]",
+            style=ERROR_COLOR,
+        )
+        raise typer.Exit(1)
+
+    tool_paths = _resolve_tool_paths(tools)
+
+    try:
+        _train(config_path, tool_paths)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Training stopped.[/yellow]", style=WARNING_COLOR)
+    except Exception as e:
+        console.print(f"[red]ERROR:[/red] Error during training: {e}", style=ERROR_COLOR)
+        raise typer.Exit(1)
+
+
+def serve_command(
+    config: Optional[str],
+    tools: Optional[List[str]],
+    port: Optional[int],
+    workers: Optional[int],
+) -> None:
+    """Serve the Nomos agent using FastAPI and Uvicorn."""
+    console = _console()
+    print_banner()
+
+    config_path = Path(config)  # type: ignore
+
+    if not config_path.exists():
+        console.print(
+            f"[red]ERROR:[/red] Configuration file not found: [bold]{config_path}[/bold]",
+            style=ERROR_COLOR,
+        )
+        raise typer.Exit(1)
+
+    tool_paths = _resolve_tool_paths(tools)
+
+    _print_panel(
+        f"[bold green]Starting server on port [bold]{port or 'config'}[/bold][/bold green]",
+        title="Serve",
+        border_style=PRIMARY_COLOR,
+        title_align="left",
+    )
+
+    # Explicit tool files replace the project's default tools directory.
+    _set_tools_env(tool_paths, include_default=not tool_paths)
+
+    from ._config_cache import load_agent_config
+    from .server import run_server
+
+    # Shared with nomos.api.agent, which loads the same file when the app is imported
+    # in this process (single worker).
+    cfg = load_agent_config(config_path)
+    run_port = port if port is not None else cfg.server.port
+    worker_count = workers if workers is not None else cfg.server.workers
+
+    run_server(config_path, port=run_port, workers=worker_count)
+
+
+def test_command(config: Optional[str], coverage: bool, pytest_args: Optional[List[str]]) -> None:
+    """Run the Nomos testing framework."""
+    console = _console()
+    print_banner()
+
+    _print_panel(
+        "[bold cyan]Running Nomos agent tests[/bold cyan]",
+        title="Testing Framework",
+        border_style=PRIMARY_COLOR,
+        title_align="left",
+    )
+
+    yaml_path = Path(config) if config else Path.cwd() / "tests.agent.yaml"
+
+    try:
+        if yaml_path.exists():
+            from .testing.yaml_runner import run_yaml_tests
+
+            result = run_yaml_tests(yaml_path, pytest_args, coverage)
+            if result != 0:
+                console.print("[red]Some tests failed![/red]", style=ERROR_COLOR)
+                raise typer.Exit(result)
+            console.print("[green]All tests passed![/green]", style=SUCCESS_COLOR)
+        else:
+            _run_tests(pytest_args, coverage)
+    except Exception as e:
+        console.print(f"[red]ERROR:[/red] Error running tests: {e}", style=ERROR_COLOR)
+        raise typer.Exit(1)
+
+
+def schema_command(output: Optional[str]) -> None:
+    """Generate JSON schema for agent configuration."""
+    from importlib.resources import files
+
+    try:
+        data = files(__package__).joinpath("_schema.json").read_bytes()
+    except FileNotFoundError:
+        # Source checkouts may not have the prebuilt schema yet.
+        from ._gen_schema import render_schema
+
+        data = render_schema()
+
+    if output:
+        # Writing to a file needs no terminal rendering, so skip Rich entirely.
+        Path(output).write_bytes(data)
+        typer.secho(f"SUCCESS: Schema written to {output}", fg=SUCCESS_COLOR)
+    else:
+        typer.echo(data, nl=False)
+
+
+def validate_command(config: str, verbose: bool) -> None:
+    """Validate agent configuration YAML file."""
+    from rich.table import Table
+
+    console = _console()
+    print_banner()
+
+    config_path = Path(config)
+
+    # Check if file exists
+    if not config_path.exists():
+        console.print(
+            f"[red]ERROR:[/red] Configuration file not found: [bold]{config_path}[/bold]",
+            style=ERROR_COLOR,
+        )
+        raise typer.Exit(1)
+
+    # Check if file has correct extension
+    if config_path.suffix.lower() not in [".yaml", ".yml"]:
+        console.print(
+            f"[yellow]WARNING:[/yellow] File extension is not .yaml or .yml: [bold]{config_path}[/bold]",
+            style=WARNING_COLOR,
+        )
+
+    _print_panel(
+        f"Validating configuration file: [bold]{config_path}[/bold]",
+        title="Configuration Validation",
+        border_style=PRIMARY_COLOR,
+        title_align="left",
+    )
+
+    try:
+        from .config import AgentConfig
+
+        # Attempt to load and validate the configuration
+        agent_config = AgentConfig.from_yaml(str(config_path))
+
+        # If we reach here, the configuration is valid
+        _print_panel(
+            "[bold green]✓ Configuration is valid![/bold green]",
+            border_style=SUCCESS_COLOR,
+        )
+
+        if verbose:
+            # Show detailed information about the configuration
+            info_table = Table(title="Configuration Details")
+            info_table.add_column("Property", style=PRIMARY_COLOR)
+            info_table.add_column("Value")
+
+            info_table.add_row("Agent Name", agent_config.name)
+            info_table.add_row("Persona", agent_config.persona or "Not specified")
+            info_table.add_row("Number of Steps", str(len(agent_config.steps)))
+            info_table.add_row("Start Step ID", agent_config.start_step_id)
+            info_table.add_row("Max Iterations", str(agent_config.max_iter))
+            info_table.add_row("Max Errors", str(agent_config.max_errors))
+            info_table.add_row("Max Examples", str(agent_config.max_examples))
+
+            if agent_config.llm:
+                if isinstance(agent_config.llm, dict):
+                    info_table.add_row("LLM", "Multiple LLMs configured")
+                    for llm_id, llm_config in agent_config.llm.items():
+                        info_table.add_row(llm_id)
+                        info_table.add_row("⮑ Provider", llm_config.provider)
+                        info_table.add_row("⮑ Model", llm_config.model)
+                else:
+                    info_table.add_row("LLM Provider", agent_config.llm.provider)
+                    info_table.add_row("LLM Model", agent_config.llm.model)
+            else:
+                info_table.add_row("LLM", "Using default (OpenAI)")
+
+            if agent_config.flows:
+                info_table.add_row("Number of Flows", str(len(agent_config.flows)))
+
+            if agent_config.session:
+                info_table.add_row("Session Store Type", agent_config.session.store_type.value)
+                info_table.add_row("Session TTL", f"{agent_config.session.default_ttl}s")
+
+            info_table.add_row("Server Port", str(agent_config.server.port))
+            info_table.add_row("Server Workers", str(agent_config.server.workers))
+
+            console.print()
+            console.print(info_table)
+
+            # Show step details
+            if agent_config.steps:
+                steps_table = Table(title="Steps Overview")
+                steps_table.add_column("Step ID", style=PRIMARY_COLOR)
+                steps_table.add_column("Description")
+                steps_table.add_column("Examples Count")
+
+                for step in agent_config.steps:
+                    example_count = len(step.examples) if step.examples else 0
+                    steps_table.add_row(
+                        step.step_id,
+                        step.description[:50] + "..."
+                        if len(step.description) > 50
+                        else step.description,
+                        str(example_count),
+                    )
+
+                console.print()
+                console.print(steps_table)
+
+        # Validation warnings and recommendations
+        warnings = []
+        recommendations = []
+
+        # Check for common issues
+        if not agent_config.persona:
+            recommendations.append("Consider adding a persona to give your agent more character")
+
+        if len(agent_config.steps) == 1:
+            recommendations.append(
+                "Single-step agents are simple - consider adding more steps for complex workflows"
+            )
+
+        if not agent_config.llm:
+            warnings.append("No LLM configuration specified - will use default OpenAI settings")
+
+        if agent_config.start_step_id not in [step.step_id for step in agent_config.steps]:
+            warnings.append(
+                f"Start step ID '{agent_config.start_step_id}' not found in defined steps"
+            )
+
+        # Check for unreachable steps
+        referenced_steps = {agent_config.start_step_id}
+        for step in agent_config.steps:
+            if step.routes:
+                for route in step.routes:
+                    referenced_steps.add(route.target)
+
+        unreachable_steps = [
+            step.step_id for step in agent_config.steps if step.step_id not in referenced_steps
+        ]
+        if unreachable_steps:
+            warnings.append(f"Potentially unreachable steps: {', '.join(unreachable_steps)}")
+
+        # Display warnings and recommendations
+        if warnings or recommendations:
+            console.print()
+
+        if warnings:
+            _print_panel(
+                "\n".join([f"• {warning}" for warning in warnings]),
+                title="[bold yellow]Warnings[/bold yellow]",
+                border_style=WARNING_COLOR,
+            )
+
+        if recommendations:
+            _print_panel(
+                "\n".join([f"• {rec}" for rec in recommendations]),
+                title="[bold blue]Recommendations[/bold blue]",
+                border_style=PRIMARY_COLOR,
+            )
+
+    except Exception as e:
+        _print_panel(
+            f"[bold red]✗ Configuration validation failed![/bold red]\n\nError: {str(e)}",
+            border_style=ERROR_COLOR,
+        )
+
+        if verbose:
+            import traceback
+
+            console.print("\n[red]Detailed error information:[/red]")
+            console.print(traceback.format_exc())
+
+        raise typer.Exit(1)
+
+
+def _generate_project_files(
+    target_dir: Path, name: str, persona: str, llm_choice: str, steps: List["Step"]
+) -> None:
+    """Generate project files for the new agent."""
+    from ._cli_templates import (
+        ENV_EXAMPLE,
+        MAIN_PY,
+        README_TMPL,
+        REQUIREMENTS_TMPL,
+        SAMPLE_TOOL_PY,
+        TOOLS_INIT_PY,
+    )
+    from .config import AgentConfig, LoggingConfig, LoggingHandler
+    from .llms import LLMConfig
+
+    # Generate config.agent.yaml
+    assert len(steps) > 0, "At least one step must be defined for the agent."
+    agent_config = AgentConfig(
+        name=name,
+        persona=persona,
+        steps=steps,
+        start_step_id=steps[0].step_id,
+        llm=LLMConfig(
+            provider=LLM_CHOICES[llm_choice]["provider"],
+            model=LLM_CHOICES[llm_choice]["model"],
+        ),
+        logging=LoggingConfig(
+            enable=True,
+            handlers=[
+                LoggingHandler(
+                    type="stderr",
+                    level="INFO",
+                    format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}",
+                )
+            ],
+        ),
+    )
+    agent_config.to_yaml(str(target_dir / "config.agent.yaml"))
+
+    # Create tools directory
+    tools_dir = target_dir / "tools"
+    tools_dir.mkdir(exist_ok=True)
+
+    project_title = name.replace("_", " ").title() if name else "My Nomos Agent"
+    provider = LLM_CHOICES[llm_choice]["provider"].lower()
+
+    # Write files
+    (tools_dir / "__init__.py").write_text(TOOLS_INIT_PY)
+    (tools_dir / "sample_tool.py").write_text(SAMPLE_TOOL_PY)
+    (target_dir / "main.py").write_text(MAIN_PY)
+    (target_dir / "requirements.txt").write_text(REQUIREMENTS_TMPL.format(provider=provider))
+    (target_dir / ".env").write_text(ENV_EXAMPLE)
+    (target_dir / "README.md").write_text(
+        README_TMPL.format(project_title=project_title, persona=persona)
+    )
+    _console().print(
+        f"[green]SUCCESS:[/green] Project files generated in [bold]{target_dir}[/bold]",
+        style=SUCCESS_COLOR,
+    )
+
+
+def _run(config_path: Path, tool_files: List[Path], verbose: bool) -> None:
+    """Run the agent in development mode."""
+    from ._dev_repl import run_dev_repl
+
+    _set_tools_env(tool_files)
+    _console().print(f"[bold cyan]Working directory:[/bold cyan] {Path.cwd()}")
+    run_dev_repl(config_path, verbose)
+
+
+def _train(config_path: Path, tool_files: List[Path]) -> None:
+    """Interactive training loop for refining agent decisions."""
+    from rich.prompt import Confirm, Prompt
+
+    from .config import AgentConfig
+    from .core import Agent
+    from .llms import OpenAI
+    from .models.agent import Action, DecisionExample
+
+    console = _console()
+
+    if not _set_tools_env(tool_files):
+        console.print(
+            "[yellow]WARNING:[/yellow] No tool files provided and no tools directory found. Running without tools.",
+            style=WARNING_COLOR,
+        )
+
+    from nomos.api.tools import tool_list
+
+    # Examples are appended to this config below, so bypass the shared config cache.
+    config = AgentConfig.from_yaml(str(config_path))
+    agent = Agent.from_config(config, tools=tool_list)
+
+    console.print(
+        f"[bold cyan]Agent[/bold cyan] [bold]{config.name}[/bold] [cyan]loaded in training mode.[/cyan]",
+        style=PRIMARY_COLOR,
+    )
+    console.print("Type quit to exit\n")
+
+    session_data: Optional[dict] = None
+    last_action: Action = Action.RESPOND
+    while True:
+        # print(session_data)
+        if last_action == Action.RESPOND:
+            user_input = Prompt.ask("You").strip()
+            if user_input.lower() in {"quit", "exit", "bye"}:
+                break
+        else:
+            user_input = None
+        res = agent.next(user_input, session_data, return_step=True, return_tool=True)
+        if res.decision.action == Action.RESPOND:
+            console.print(
+                "Agent:\nReasoning:{}\nResponse: {}".format(
+                    "\n".join(res.decision.reasoning), res.decision.response
+                ),
+                style=PRIMARY_COLOR,
+            )
+        elif res.decision.action == Action.TOOL_CALL:
+            console.print(
+                "Agent:\nReasoning:{}\nTool call: {}\nTool Result: {}".format(
+                    "\n".join(res.decision.reasoning),
+                    res.decision.tool_call,
+                    res.tool_output,
+                ),
+                style=PRIMARY_COLOR,
+            )
+        elif res.decision.action == Action.MOVE:
+            console.print(
+                "Agent:\nReasoning:{}\nMoving to step: {}".format(
+                    "\n".join(res.decision.reasoning), res.decision.step_id
+                ),
+                style=PRIMARY_COLOR,
+            )
+        elif res.decision.action == Action.END:
+            console.print(
+                "Agent:\nReasoning:{}\nEnding session.".format("\n".join(res.decision.reasoning)),
+                style=PRIMARY_COLOR,
+            )
+            break
+        else:
+            console.print(
+                "Agent:\nReasoning:{}\nUnknown action: {}".format(
+                    "\n".join(res.decision.reasoning), res.decision.action
+                ),
+                style=ERROR_COLOR,
+            )
+
+        if Confirm.ask("Are you satisfied with this decision?", default=True):
+            last_action = res.decision.action
+            continue
+
+        feedback = Prompt.ask("What should have happened?")
+
+        assert res.state is not None, "Session state is None. Cannot take step back."
+
+        flow_memory_context = (
+            res.state.flow_state.flow_memory_context if res.state.flow_state else None
+        )
+        llms = config.get_llm() or {}
+        llm = llms.get("global") or OpenAI()
+        context_summary = llm.generate_summary(
+            flow_memory_context[:-1]
+            if flow_memory_context and len(flow_memory_context) > 1
+            else res.state.history[:-1]
+            if len(res.state.history) > 1
+            else []
+        )
+
+        for step in config.steps:
+            if step.step_id == res.state.current_step_id:
+                if step.examples is None:
+                    step.examples = []
+                step.examples.append(
+                    DecisionExample(context=" ".join(context_summary.summary), decision=feedback)
+                )
+                break
+
+        config.to_yaml(str(config_path))
+        agent = Agent.from_config(config, tools=tool_list)
+        console.print(
+            f"[green]SUCCESS:[/green] Example added for step {res.state.current_step_id}. Agent reloaded."
+        )
+
+
+def _run_tests(pytest_args: Optional[List[str]] = None, coverage: bool = False) -> None:
+    """Run tests using pytest."""
+    import subprocess
+
+    console = _console()
+    cmd = ["python", "-m", "pytest"] + (pytest_args or ["."])
+
+    if coverage:
+        cmd.extend(["--cov=.", "--cov-report=term-missing"])
+
+    console.print(
+        f"Running tests with command: [bold]{' '.join(cmd)}[/bold]",
+        style=PRIMARY_COLOR,
+    )
+
+    result = subprocess.run(cmd)
+
+    if result.returncode == 0:
+        console.print("[green]All tests passed![/green]", style=SUCCESS_COLOR)
+    else:
+        console.print("[red]Some tests failed![/red]", style=ERROR_COLOR)
+        raise typer.Exit(result.returncode)
+
+
+def _handle_config_generation(
+    usecase: str,
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    tools: Optional[str] = None,
+) -> "AgentConfiguration":
+    """Handle AI generation of agent configuration."""
+    from .llms import LLMConfig
+    from .utils.generator import AgentGenerator
+
+    llm_config: Optional[LLMConfig] = None
+    if provider or model:
+        llm_config = LLMConfig(
+            provider=provider,
+            model=model,
+        )
+    generator = AgentGenerator(
+        console=_console(),
+        llm_config=llm_config,
+    )
+    return generator.generate(usecase=usecase, tools_available=tools)
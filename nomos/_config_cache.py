@@ -0,0 +1,53 @@
+"""In-process cache for agent configurations loaded from YAML."""
+
+import functools
+import os
+from pathlib import Path
+from typing import FrozenSet, Tuple, Union
+
+from .config import AgentConfig
+
+
+@functools.lru_cache(maxsize=16)
+def _load(
+    path: str, mtime_ns: int, size: int, ino: int, env: FrozenSet[Tuple[str, str]]
+) -> AgentConfig:
+    """Parse and validate the configuration file (cached by file identity and environment)."""
+    return AgentConfig.from_yaml(path)
+
+
+def _referenced_env(text: str) -> FrozenSet[Tuple[str, str]]:
+    """
+    Return the environment variables a configuration may substitute, with their values.
+
+    ``from_yaml`` replaces ``$NAME`` values from ``os.environ``, so every set variable
+    whose ``$NAME`` appears in the file is included. This may include a few unrelated
+    names, which only makes the key stricter.
+    """
+    if "$" not in text:
+        return frozenset()
+    return frozenset((name, value) for name, value in os.environ.items() if f"${name}" in text)
+
+
+def load_agent_config(path: Union[str, Path]) -> AgentConfig:
+    """
+    Load an agent configuration, reusing the parsed result while its inputs are unchanged.
+
+    The cache is keyed by path, modification time, size and inode, so any edit or
+    replacement of the file triggers a fresh parse. ``$VAR`` values are filled in from
+    the environment, so the values of the variables the file references are part of
+    the key too, and changing one (e.g. through ``load_dotenv``) also triggers a fresh
+    parse. The returned object is shared between callers and must be treated as
+    read-only; use ``AgentConfig.from_yaml`` when the configuration is going to be
+    modified.
+
+    :param path: Path to the YAML configuration file.
+    :return: The loaded AgentConfig.
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        text = f.read().decode("utf-8", errors="replace")
+    return _load(str(path), st.st_mtime_ns, st.st_size, st.st_ino, _referenced_env(text))
+
+
+__all__ = ["load_agent_config"]
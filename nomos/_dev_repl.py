@@ -0,0 +1,65 @@
+"""Interactive development loop used by ``nomos run``."""
+
+import sys
+from pathlib import Path
+
+
+def run_dev_repl(config_path: Path, verbose: bool) -> None:
+    """
+    Run the agent interactively in the current process.
+
+    Tools are discovered through ``nomos.api.tools``, so ``TOOLS_PATH`` must be set
+    before this is called. ``KeyboardInterrupt`` is left to the caller.
+
+    :param config_path: Path to the agent configuration file.
+    :param verbose: Whether to show verbose session output and error tracebacks.
+    """
+    current_dir = Path.cwd()
+    env_file = current_dir / ".env.local"
+    if env_file.exists():
+        from dotenv import load_dotenv
+
+        load_dotenv(dotenv_path=env_file)
+    else:
+        print("WARNING: .env file not found. Environment variables will not be loaded.")
+
+    if str(current_dir) not in sys.path:
+        sys.path.insert(0, str(current_dir))
+
+    from .api.tools import tool_list
+    from .config import AgentConfig
+    from .core import Agent
+    from .models.agent import Action
+
+    config = AgentConfig.from_yaml(str(config_path))
+    agent = Agent.from_config(config, tools=tool_list)
+    session = agent.create_session()
+
+    print(f"Agent {config.name} ready in interactive mode!")
+    print(f"Config: {config_path}")
+    print("Type (quit, exit, bye) to exit\n")
+
+    while True:
+        try:
+            user_input = input("You: ").strip()
+        except EOFError:
+            break
+        if user_input.lower() in ("quit", "exit", "bye"):
+            break
+        if not user_input:
+            continue
+        try:
+            res = session.next(user_input, verbose=verbose)
+        except Exception as e:
+            print(f"Error: {e}")
+            if verbose:
+                import traceback
+
+                traceback.print_exc()
+                break
+            continue
+        print(f"Agent: {res.decision.response}")
+        print()
+        if res.decision.action == Action.END:
+            print("Session ended.")
+            break
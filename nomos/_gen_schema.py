@@ -0,0 +1,46 @@
+"""Generate ``nomos/_schema.json``, the prebuilt schema served by ``nomos schema``.
+
+The schema only changes when the configuration models do, so it is rendered ahead of
+time instead of on every invocation. Regenerate it with ``python -m nomos._gen_schema``
+after changing any model reachable from :class:`nomos.config.AgentConfig`.
+"""
+
+from pathlib import Path
+from typing import Any, Callable
+
+from .config import AgentConfig
+
+SCHEMA_PATH = Path(__file__).with_name("_schema.json")
+
+_dump: Callable[[Any], bytes]
+try:
+    import orjson
+
+    def _dump(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    def _dump(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+
+def render_schema() -> bytes:
+    """
+    Render the AgentConfig JSON schema exactly as it is stored on disk.
+
+    ``orjson`` is used when installed; its indented output is byte-for-byte the same as
+    ``json.dumps(..., indent=2)`` for the (ASCII-only) schema.
+    """
+    return _dump(AgentConfig.model_json_schema()) + b"\n"
+
+
+def main() -> None:
+    """Write the rendered schema next to this module."""
+    SCHEMA_PATH.write_bytes(render_schema())
+    print(f"Schema written to {SCHEMA_PATH}")
+
+
+if __name__ == "__main__":
+    main()
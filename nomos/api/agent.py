@@ -20,11 +20,12 @@ if os.getenv("ENABLE_TRACING", "false").lower() == "true":
     )
 
 import nomos  # noqa
+from nomos._config_cache import load_agent_config
 from nomos.llms.openai import OpenAI
 
 from .tools import tool_list
 
-config = nomos.AgentConfig.from_yaml(os.getenv("CONFIG_PATH", "config.agent.yaml"))
+config = load_agent_config(os.getenv("CONFIG_PATH", "config.agent.yaml"))
 llm = config.get_llm() if hasattr(config, "llm") and config.llm else OpenAI()
 agent = nomos.Agent.from_config(config, llm, tool_list)
 
@@ -300,9 +300,7 @@ class AgentConfig(BaseSettings):
         if config.schemas:
             from .utils.schema_loader import schema_registry
 
-            base_path = os.path.dirname(file_path)
-            for schema_name, schema_path in config.schemas.items():
-                schema_registry.load_schema(schema_name, schema_path, base_path)
+            schema_registry.load_schemas(config.schemas, os.path.dirname(file_path))
 
         return config
 
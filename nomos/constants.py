@@ -55,6 +55,9 @@ LLM_CHOICES = {
     },
 }
 
+LLM_CHOICE_NAMES: tuple[str, ...] = tuple(LLM_CHOICES)
+LLM_CHOICE_INDEX_STRS: tuple[str, ...] = tuple(str(i) for i in range(1, len(LLM_CHOICES) + 1))
+
 TEMPLATES = {
     "basic": {
         "name": "basic_agent",
@@ -203,21 +203,21 @@ class Step(BaseModel):
             if len(parts) == 1:
                 # Just schema name, use the first available model or try case-insensitive match
                 schema_name = parts[0]
-                schema_models = schema_registry._schemas.get(schema_name, {})
-                if not schema_models:
+                model_names = schema_registry.model_names(schema_name)
+                if not model_names:
                     raise ValueError(f"Step '{self.step_id}': Schema '{schema_name}' not found")
 
                 # Try exact match first
-                if schema_name in schema_models:
-                    return schema_models[schema_name]
+                if schema_name in model_names:
+                    return schema_registry.get_model(schema_name, schema_name)
 
                 # Try case-insensitive match
-                for model_name, model in schema_models.items():
+                for model_name in model_names:
                     if model_name.lower() == schema_name.lower():
-                        return model
+                        return schema_registry.get_model(schema_name, model_name)
 
                 # Use the first available model
-                return next(iter(schema_models.values()))
+                return schema_registry.get_model(schema_name, model_names[0])
             elif len(parts) == 2:
                 schema_name, model_name = parts
                 return schema_registry.get_model(schema_name, model_name)
@@ -6,8 +6,6 @@ from functools import lru_cache
 from logging import Logger
 
 from loguru import logger
-from rich.console import Console
-from rich.panel import Panel
 
 from ..models.agent import Action, Response
 
@@ -60,6 +58,9 @@ def log_error(message: str) -> None:
 
 def pp_response(response: "Response") -> None:
     """Print the response from a Nomos session using rich panels."""
+    from rich.console import Console
+    from rich.panel import Panel
+
     console = Console()
     decision = response.decision
     tool_output = response.tool_output
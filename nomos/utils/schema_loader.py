@@ -1,148 +1,579 @@
 """Schema loading and management utilities."""
 
-import importlib.util
-import json
+import functools
+import hashlib
 import os
-from typing import Any, Dict, List, Optional, Type
+import sys
+import threading
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is unchanged.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+# Shared by every generated model; matches create_base_model's configuration.
+_MODEL_CONFIG = ConfigDict(extra="ignore")
+
+_PRIMITIVE_TYPES: Dict[str, type] = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+}
+
+# JSON files larger than this are streamed with ijson (``nomos[schemas]``), keeping only
+# the sections below instead of materializing the whole document. The extracted
+# sections are also cached on disk (under $NOMOS_CACHE_DIR, default
+# $XDG_CACHE_HOME/nomos or ~/.cache/nomos).
+_STREAM_THRESHOLD = 2 * 1024 * 1024
+_SCHEMA_SECTIONS = ("properties", "required", "definitions")
+
+_DICT_ANY = Dict[str, Any]
+_LIST_ANY = List[Any]
+
+
+@functools.lru_cache(maxsize=1024)
+def _as_list(item_type: Any) -> Any:
+    """Return ``List[item_type]``, reusing the alias for repeated item types."""
+    return List[item_type]  # type: ignore[valid-type]
+
+
+def _stream_schema_sections(f: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Read only the top-level schema sections the registry uses, or None without ijson."""
+    try:
+        import ijson
+    except ImportError:
+        return None
+
+    # One pass over the top-level members; other sections are parsed one at a time and
+    # dropped rather than kept for the whole document.
+    return {
+        key: value for key, value in ijson.kvitems(f, "", use_float=True) if key in _SCHEMA_SECTIONS
+    }
+
+
+def _disk_cache_path(file_path: str) -> Path:
+    """Return the on-disk cache entry for a schema file (one entry per file)."""
+    cache_dir = os.environ.get("NOMOS_CACHE_DIR")
+    if not cache_dir:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+        cache_dir = os.path.join(xdg_cache, "nomos")
+    digest = hashlib.blake2b(os.path.realpath(file_path).encode(), digest_size=16).hexdigest()
+    return Path(cache_dir).expanduser() / "schemas" / f"{digest}.json"
+
+
+def _dump_cache_entry(entry: Dict[str, Any]) -> bytes:
+    """Serialize a disk cache entry."""
+    try:
+        from orjson import dumps
+    except ImportError:
+        import json
+
+        return json.dumps(entry).encode()
+    return dumps(entry)
+
+
+def _load_large_schema(file_path: str, st: os.stat_result) -> Dict[str, Any]:
+    """Load the schema sections of a large JSON file, going through the on-disk cache."""
+    cache_path = _disk_cache_path(file_path)
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        # Missing, unreadable or corrupt entries (JSON and Unicode decode errors are
+        # ValueErrors) are all cache misses; the entry is rewritten below.
+        cached = None
+    # Entries record the version of the file they were made from; an entry for an
+    # older version is a miss and gets overwritten, so edits don't accumulate files.
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtime_ns") == st.st_mtime_ns
+        and cached.get("size") == st.st_size
+        and isinstance(cached.get("sections"), dict)
+    ):
+        return cached["sections"]
+
+    with open(file_path, "rb") as f:
+        schema_data = _stream_schema_sections(f)
+        if schema_data is None:
+            document = _json_loads(f.read())
+            if not isinstance(document, dict):
+                document = {}
+            schema_data = {key: document[key] for key in _SCHEMA_SECTIONS if key in document}
+
+    # Write to a temporary file and rename, so concurrent readers never see a partial entry.
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sections": schema_data}
+        tmp_path.write_bytes(_dump_cache_entry(entry))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Not cacheable (e.g. orjson rejects integers wider than 64 bits); parse next time.
+        pass
+    return schema_data
+
+
+def _iter_model_schemas(
+    name: str, schema_data: Dict[str, Any]
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield ``(model_name, schema)`` for every model a JSON schema document provides.
+
+    That is the root (named after the schema) when it has properties, each object
+    property with properties of its own, and each entry under ``definitions``.
+    """
+    properties = schema_data.get("properties")
+    if properties is not None:
+        yield name, schema_data
+        for prop_name, prop_schema in properties.items():
+            if prop_schema.get("type") == "object" and "properties" in prop_schema:
+                yield prop_name, prop_schema
+
+    yield from schema_data.get("definitions", {}).items()
+
+
+_DEFINITIONS_REF = "#/definitions/"
+
+
+def _iter_refs(node: Any) -> Iterator[str]:
+    """Yield every ``$ref`` string found anywhere in a JSON schema subtree."""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            yield ref
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _iter_refs(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _iter_refs(item)
+
+
+def _definition_name(ref: str) -> Optional[str]:
+    """Return the definition a local ``#/definitions/...`` reference points to."""
+    if not ref.startswith(_DEFINITIONS_REF):
+        return None
+    return ref[len(_DEFINITIONS_REF) :].replace("~1", "/").replace("~0", "~")
+
+
+def _is_model_schema(schema: Dict[str, Any]) -> bool:
+    """Return whether a definition is an object with properties, i.e. becomes a model."""
+    return "properties" in schema and schema.get("type", "object") == "object"
+
+
+def _type_token(tp: Any) -> str:
+    """Return a stable name for a resolved type, for use in model cache keys."""
+    return tp.__name__ if isinstance(tp, type) else repr(tp)
+
+
+def _referenced_definitions(schema: Dict[str, Any], definitions: Dict[str, Any]) -> Set[str]:
+    """
+    Return the local definitions a schema references.
+
+    Models only use their properties, so only those are searched; for other schemas
+    (enums, arrays, maps, aliases) everything but nested definitions is.
+    """
+    if _is_model_schema(schema):
+        scope: Any = schema["properties"]
+    else:
+        scope = {key: value for key, value in schema.items() if key != "definitions"}
+    deps = set()
+    for ref in _iter_refs(scope):
+        def_name = _definition_name(ref)
+        if def_name is not None and def_name in definitions:
+            deps.add(def_name)
+    return deps
+
+
+def _resolve_refs(
+    schema: Dict[str, Any], definitions: Dict[str, Any]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Set[str]]]:
+    """
+    Collect the definitions a schema depends on through ``$ref``, directly or transitively.
+
+    :param schema: Schema whose references are followed
+    :param definitions: The document's ``definitions`` section
+    :return: The referenced definitions by name, and the definitions each of them references
+    """
+    nodes: Dict[str, Dict[str, Any]] = {}
+    edges: Dict[str, Set[str]] = {}
+    queue = list(_referenced_definitions(schema, definitions))
+    while queue:
+        def_name = queue.pop()
+        if def_name in nodes:
+            continue
+        nodes[def_name] = definitions[def_name]
+        edges[def_name] = _referenced_definitions(nodes[def_name], definitions)
+        queue.extend(edges[def_name] - nodes.keys())
+    return nodes, edges
+
+
+def _build_order(edges: Dict[str, Set[str]]) -> List[str]:
+    """
+    Order definitions so each comes after the definitions it references.
 
-from pydantic import BaseModel
+    References that close a cycle are ignored here and left unresolved.
+    """
+    order: List[str] = []
+    state: Dict[str, bool] = {}  # False while visiting, True once placed
+
+    def visit(def_name: str) -> None:
+        if def_name in state:
+            return
+        state[def_name] = False
+        for dep in sorted(edges[def_name]):
+            visit(dep)
+        state[def_name] = True
+        order.append(def_name)
 
-from .utils import create_base_model
+    for def_name in sorted(edges):
+        visit(def_name)
+    return order
+
+
+def _schema_key(schema: Dict[str, Any]) -> str:
+    """Return a stable digest of a JSON schema dict, used as a model cache key."""
+    import json
+
+    canonical = json.dumps(schema, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+class _LazyModels(Mapping[str, Type[BaseModel]]):
+    """Read-only view of a loaded schema's models that builds each one on first access."""
+
+    def __init__(self, registry: "SchemaRegistry", schema_name: str, names: List[str]):
+        self._registry = registry
+        self._schema_name = schema_name
+        self._names = tuple(names)
+
+    def __getitem__(self, model_name: str) -> Type[BaseModel]:
+        if model_name not in self._names:
+            raise KeyError(model_name)
+        return self._registry.get_model(self._schema_name, model_name)
+
+    def __contains__(self, model_name: object) -> bool:
+        # Mapping's default goes through __getitem__, which would build the model.
+        return model_name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"<models of schema {self._schema_name!r}: {', '.join(self._names)}>"
 
 
 class SchemaRegistry:
-    """Registry for loading and managing schemas from files."""
+    """
+    Registry for loading and managing schemas from files.
+
+    JSON schemas are loaded in two phases: ``load_schema`` only parses the file and
+    records the model names it provides, and each Pydantic model is built the first
+    time it is requested through ``get_model``.
+    """
 
     def __init__(self):
+        # Models built so far, per schema.
         self._schemas: Dict[str, Dict[str, Type[BaseModel]]] = {}
+        # Raw JSON schema dicts not yet turned into models, per schema.
+        self._pending: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # All model names of each schema, in file order.
+        self._model_names: Dict[str, List[str]] = {}
+        # Models by schema digest, so identical (sub-)schemas share one class.
+        self._model_cache: Dict[str, Type[BaseModel]] = {}
+        # Last parsed version of each JSON schema file by (name, path): its mtime_ns, the
+        # document and its raw model schemas by model name. A changed file replaces its
+        # entry, so only the current version is kept.
+        self._file_cache: Dict[
+            Tuple[str, str], Tuple[int, Dict[str, Any], Dict[str, Dict[str, Any]]]
+        ] = {}
+        # JSON schema documents and their compiled validators, per schema. Documents of
+        # large files only hold _SCHEMA_SECTIONS; their paths are kept so validators can
+        # still be compiled from the whole file.
+        self._raw: Dict[str, Dict[str, Any]] = {}
+        self._sections_only: Dict[str, str] = {}
+        self._validators: Dict[str, Callable[[Any], Any]] = {}
+        # Models found in Python schema files by (real path, mtime_ns).
+        self._py_module_cache: Dict[Tuple[str, int], Dict[str, Type[BaseModel]]] = {}
+        # Per-key locks, so concurrent callers never build the same schema or model twice.
+        # Schema locks live as long as the schema name; a model's lock is dropped once
+        # the model is in _model_cache, which then answers without locking.
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_mu = threading.Lock()
+
+    def _lock_for(self, kind: str, key: str) -> threading.Lock:
+        """Return the lock guarding one schema (``kind="schema"``) or model digest."""
+        with self._locks_mu:
+            lock = self._locks.get((kind, key))
+            if lock is None:
+                lock = self._locks[(kind, key)] = threading.Lock()
+            return lock
 
     def load_schema(
         self, name: str, file_path: str, base_path: Optional[str] = None
-    ) -> Dict[str, Type[BaseModel]]:
+    ) -> Mapping[str, Type[BaseModel]]:
         """
         Load a schema from a file.
 
+        Models from JSON files are built lazily, when first looked up in the returned
+        mapping or through ``get_model`` (or ``materialize_all``).
+
         :param name: Name of the schema
         :param file_path: Path to the schema file
         :param base_path: Base path to resolve relative paths
-        :return: Dictionary mapping model names to BaseModel classes
+        :return: Mapping of model names (in file order) to BaseModel classes
         """
         if base_path:
             file_path = os.path.join(base_path, file_path)
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Schema file not found: {file_path}")
+        # One stat call checks existence and provides the mtime/size used by the caches.
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Schema file not found: {file_path}") from None
 
         file_ext = os.path.splitext(file_path)[1].lower()
 
-        if file_ext == ".json":
-            return self._load_json_schema(name, file_path)
-        elif file_ext == ".py":
-            return self._load_python_schema(name, file_path)
-        else:
-            raise ValueError(f"Unsupported schema file type: {file_ext}")
-
-    def _load_json_schema(self, name: str, file_path: str) -> Dict[str, Type[BaseModel]]:
-        """Load schema from JSON file."""
-        with open(file_path, "r") as f:
-            schema_data = json.load(f)
-
-        models = {}
-
-        # Handle root level schema
-        if "properties" in schema_data:
-            # Create a model for the root schema
-            model = self._json_schema_to_pydantic(schema_data)
-            models[name] = model
-
-            # Also create models for individual properties if they are objects
-            for prop_name, prop_schema in schema_data.get("properties", {}).items():
-                if prop_schema.get("type") == "object" and "properties" in prop_schema:
-                    prop_model = self._json_schema_to_pydantic(prop_schema)
-                    models[prop_name] = prop_model
+        with self._lock_for("schema", name):
+            if file_ext == ".json":
+                self._raw[name], raw_models = self._load_json_schema(name, file_path, st)
+                if st.st_size > _STREAM_THRESHOLD:
+                    self._sections_only[name] = file_path
+                else:
+                    self._sections_only.pop(name, None)
+                self._schemas[name] = {}
+                # get_model pops from the pending table, so keep the cached index intact.
+                self._pending[name] = dict(raw_models)
+                self._model_names[name] = list(raw_models)
+            elif file_ext == ".py":
+                self._load_python_schema(name, file_path, st)
+                self._raw.pop(name, None)
+                self._sections_only.pop(name, None)
+            else:
+                raise ValueError(f"Unsupported schema file type: {file_ext}")
+            self._validators.pop(name, None)
+            return _LazyModels(self, name, self._model_names[name])
 
-        # Handle definitions
-        if "definitions" in schema_data:
-            for def_name, def_schema in schema_data["definitions"].items():
-                model = self._json_schema_to_pydantic(def_schema)
-                models[def_name] = model
+    def load_schemas(
+        self, schemas: Dict[str, str], base_path: Optional[str] = None
+    ) -> Dict[str, Mapping[str, Type[BaseModel]]]:
+        """
+        Load several schemas, e.g. the ``schemas`` section of an agent configuration.
 
-        self._schemas[name] = models
-        return models
+        :param schemas: Mapping of schema names to file paths
+        :param base_path: Base path to resolve relative paths
+        :return: The models of each schema, as returned by ``load_schema``
+        """
+        return {
+            name: self.load_schema(name, file_path, base_path)
+            for name, file_path in schemas.items()
+        }
+
+    def _load_json_schema(
+        self, name: str, file_path: str, st: os.stat_result
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """Parse a JSON schema file into the document and its raw model schemas by model name."""
+        cache_key = (name, file_path)
+        cached = self._file_cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1], cached[2]
+
+        if st.st_size > _STREAM_THRESHOLD:
+            schema_data = _load_large_schema(file_path, st)
+        else:
+            with open(file_path, "rb") as f:
+                schema_data = _json_loads(f.read())
+
+        # Bare $ref/allOf wrappers would otherwise register an empty schema, deferring the
+        # failure to a confusing "model not found" later; non-object documents (null,
+        # numbers, lists) would fail with a TypeError or AttributeError instead.
+        if not isinstance(schema_data, dict) or (
+            "properties" not in schema_data and "definitions" not in schema_data
+        ):
+            raise ValueError(f"Schema '{name}' has no properties or definitions")
+
+        raw_models = dict(_iter_model_schemas(name, schema_data))
+        self._file_cache[cache_key] = (st.st_mtime_ns, schema_data, raw_models)
+        return schema_data, raw_models
+
+    def _json_schema_to_pydantic(
+        self, schema: Dict[str, Any], refs: Optional[Dict[str, Any]] = None
+    ) -> Type[BaseModel]:
+        """
+        Convert JSON schema to Pydantic BaseModel, reusing models for identical schemas.
 
-    def _json_schema_to_pydantic(self, schema: Dict[str, Any]) -> Type[BaseModel]:
-        """Convert JSON schema to Pydantic BaseModel."""
-        fields = {}
+        Nested object properties are built (and cached) along with their parent, so a later
+        ``get_model`` for one of them is a cache hit rather than a second build.
 
-        if "properties" in schema:
-            required = schema.get("required", [])
-            for prop_name, prop_schema in schema["properties"].items():
-                field_type = self._json_type_to_python(prop_schema)
+        :param schema: Object schema to convert
+        :param refs: Already-built types for ``$ref`` strings; other references become Any
+        """
+        properties = schema.get("properties")
+        # Only these keys shape the model; leaving out e.g. a root schema's definitions
+        # keeps the key cheap to compute. Resolved references are keyed by the name of
+        # the model they point to, which is itself derived from that model's shape.
+        key_data: Dict[str, Any] = {"properties": properties, "required": schema.get("required")}
+        if refs:
+            # Only the references this schema uses; an unrelated entry would split the
+            # cache between otherwise identical schemas depending on build order.
+            used = {ref: _type_token(refs[ref]) for ref in _iter_refs(properties) if ref in refs}
+            if used:
+                key_data["refs"] = used
+        key = _schema_key(key_data)
+        cached = self._model_cache.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock_for("model", key):
+            cached = self._model_cache.get(key)
+            if cached is not None:
+                return cached
+            try:
+                model = self._build_model(key, properties, schema.get("required", ()), refs)
+                self._model_cache[key] = model
+            finally:
+                # Threads already waiting hold the lock object and re-check the cache.
+                with self._locks_mu:
+                    self._locks.pop(("model", key), None)
+            return model
+
+    def _build_model(
+        self,
+        key: str,
+        properties: Optional[Dict[str, Any]],
+        required_names: Any,
+        refs: Optional[Dict[str, Any]],
+    ) -> Type[BaseModel]:
+        """Create the Pydantic model for an object schema's properties."""
+        fields: Dict[str, Any] = {}
+
+        if properties:
+            required = frozenset(required_names)
+            json_type_to_python = self._json_type_to_python
+            for prop_name, prop_schema in properties.items():
+                field_type = json_type_to_python(prop_schema, refs)
                 default_val = ... if prop_name in required else None
-                description = prop_schema.get("description", "")
-
-                if description:
-                    field_info = {
-                        "type": field_type,
-                        "default": default_val,
-                        "description": description,
-                    }
-                else:
-                    field_info = {"type": field_type, "default": default_val}
-
-                fields[prop_name] = field_info
-
-        return create_base_model("DynamicModel", fields)
-
-    def _json_type_to_python(self, schema: Dict[str, Any]) -> Any:
+                description = prop_schema.get("description")
+                fields[prop_name] = (
+                    field_type,
+                    Field(default=default_val, description=description)
+                    if description
+                    else default_val,
+                )
+
+        # Name models after their shape, so the name is stable across runs and
+        # distinct shapes no longer all share the name "DynamicModel".
+        return create_model(f"M_{key[:12]}", __config__=_MODEL_CONFIG, **fields)
+
+    def _json_type_to_python(
+        self, schema: Dict[str, Any], refs: Optional[Dict[str, Any]] = None
+    ) -> Any:
         """Convert JSON schema type to Python type."""
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            return refs.get(ref, Any) if refs else Any
+
         json_type = schema.get("type")
 
-        if json_type == "string":
-            return str
-        elif json_type == "number":
-            return float
-        elif json_type == "integer":
-            return int
-        elif json_type == "boolean":
-            return bool
-        elif json_type == "object":
+        # "type" may also be a list of types (e.g. ["string", "null"]), which is unhashable.
+        if isinstance(json_type, str):
+            primitive = _PRIMITIVE_TYPES.get(json_type)
+            if primitive is not None:
+                return primitive
+        if json_type == "object":
             if "properties" in schema:
-                return self._json_schema_to_pydantic(schema)
+                return self._json_schema_to_pydantic(schema, refs)
             else:
-                return Dict[str, Any]
+                return _DICT_ANY
         elif json_type == "array":
             if "items" in schema:
-                item_type = self._json_type_to_python(schema["items"])
-                return List[item_type]  # type: ignore
+                return _as_list(self._json_type_to_python(schema["items"], refs))
             else:
-                return List[Any]
+                return _LIST_ANY
         else:
             return Any
 
-    def _load_python_schema(self, name: str, file_path: str) -> Dict[str, Type[BaseModel]]:
-        """Load schema from Python module."""
-        spec = importlib.util.spec_from_file_location(name, file_path)
+    def _load_python_schema(
+        self, name: str, file_path: str, st: os.stat_result
+    ) -> Dict[str, Type[BaseModel]]:
+        """Load schema from Python module, importing each file only once while it is unchanged."""
+        cache_key = (os.path.realpath(file_path), st.st_mtime_ns)
+        models = self._py_module_cache.get(cache_key)
+        if models is None:
+            models = self._import_python_schema(name, file_path)
+            self._py_module_cache[cache_key] = models
+
+        models = dict(models)
+        self._schemas[name] = models
+        self._pending[name] = {}
+        self._model_names[name] = list(models)
+        return models
+
+    @staticmethod
+    def _import_python_schema(name: str, file_path: str) -> Dict[str, Type[BaseModel]]:
+        """Import a Python schema file and collect its BaseModel subclasses."""
+        import importlib.util
+
+        # Registered under a private prefix so a schema name cannot shadow a real module,
+        # while still letting pickle and dataclasses resolve the module by name.
+        module_name = f"_nomos_schema_{name}"
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
         if spec is None or spec.loader is None:
             raise ImportError(f"Could not load Python module: {file_path}")
 
         module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
 
         models = {}
 
-        # Find all BaseModel subclasses in the module
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if isinstance(attr, type) and issubclass(attr, BaseModel) and attr != BaseModel:
+        # Find all BaseModel subclasses in the module, in definition order.
+        # (isinstance rather than type() is type: models use Pydantic's metaclass.)
+        base_model = BaseModel
+        for attr_name, attr in vars(module).items():
+            if attr_name.startswith("__"):
+                continue
+            if isinstance(attr, type) and attr is not base_model and issubclass(attr, base_model):
                 models[attr_name] = attr
 
-        self._schemas[name] = models
         return models
 
+    def model_names(self, schema_name: str) -> List[str]:
+        """
+        Get the names of the models provided by a schema, without building them.
+
+        :param schema_name: Name of the schema
+        :return: Model names in file order (empty if the schema is not loaded)
+        """
+        return list(self._model_names.get(schema_name, ()))
+
     def get_model(self, schema_name: str, model_name: str) -> Type[BaseModel]:
         """
-        Get a model from the registry.
+        Get a model from the registry, building it on first access.
 
         :param schema_name: Name of the schema
         :param model_name: Name of the model
@@ -151,11 +582,121 @@ class SchemaRegistry:
         if schema_name not in self._schemas:
             raise ValueError(f"Schema '{schema_name}' not found")
 
+        model = self._schemas[schema_name].get(model_name)
+        if model is not None:
+            return model
+
+        with self._lock_for("schema", schema_name):
+            # Re-check: another thread may have built it (or reloaded the schema) meanwhile.
+            schema_models = self._schemas[schema_name]
+            model = schema_models.get(model_name)
+            if model is not None:
+                return model
+
+            pending = self._pending[schema_name]
+            raw_schema = pending.get(model_name)
+            if raw_schema is None:
+                raise ValueError(f"Model '{model_name}' not found in schema '{schema_name}'")
+
+            refs = self._build_referenced_models(schema_name, raw_schema)
+            # A definition that refers back to itself is built as part of its own refs.
+            if model_name in schema_models:
+                return schema_models[model_name]
+            model = self._json_schema_to_pydantic(raw_schema, refs)
+            schema_models[model_name] = model
+            del pending[model_name]
+            return model
+
+    def _build_referenced_models(
+        self, schema_name: str, raw_schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Resolve the definitions a raw schema references, dependencies first.
+
+        Definitions that are objects with properties are built once and registered under
+        their name, so later references (and ``get_model`` calls for it) reuse the same
+        class. Other definitions (enums, arrays, maps) resolve to the type they describe.
+        References that form a cycle are left unresolved and typed as Any.
+        Must be called with the schema's lock held.
+
+        :return: Resolved types keyed by ``$ref`` string
+        """
+        definitions = self._raw.get(schema_name, {}).get("definitions")
+        if not definitions:
+            return {}
+        nodes, edges = _resolve_refs(raw_schema, definitions)
+        if not nodes:
+            return {}
+
         schema_models = self._schemas[schema_name]
-        if model_name not in schema_models:
-            raise ValueError(f"Model '{model_name}' not found in schema '{schema_name}'")
+        pending = self._pending[schema_name]
+        refs: Dict[str, Any] = {}
+        for def_name in _build_order(edges):
+            ref = _DEFINITIONS_REF + def_name.replace("~", "~0").replace("/", "~1")
+            definition = nodes[def_name]
+            if not _is_model_schema(definition):
+                refs[ref] = self._json_type_to_python(definition, refs)
+                continue
+            model = schema_models.get(def_name)
+            if model is None:
+                model = self._json_schema_to_pydantic(definition, refs)
+                if pending.get(def_name) is definition:
+                    schema_models[def_name] = model
+                    del pending[def_name]
+            refs[ref] = model
+        return refs
+
+    def get_validator(self, schema_name: str) -> Callable[[Any], Any]:
+        """
+        Get a compiled validator for a JSON schema, for callers that only need validation.
+
+        The validator is generated with ``fastjsonschema`` and skips Pydantic entirely.
+        It returns the (possibly default-filled) data, or raises
+        ``fastjsonschema.JsonSchemaValueException`` when the data is invalid.
+
+        :param schema_name: Name of a schema loaded from a JSON file
+        :return: Validation function taking the data to check
+        """
+        validator = self._validators.get(schema_name)
+        if validator is not None:
+            return validator
 
-        return schema_models[model_name]
+        if schema_name not in self._raw:
+            if schema_name in self._schemas:
+                raise ValueError(f"Schema '{schema_name}' was not loaded from a JSON file")
+            raise ValueError(f"Schema '{schema_name}' not found")
+
+        try:
+            import fastjsonschema
+        except ImportError:
+            raise ImportError(
+                "fastjsonschema is required for schema validators. "
+                "Install with 'pip install nomos[schemas]'"
+            )
+
+        document = self._raw[schema_name]
+        source = self._sections_only.get(schema_name)
+        if source is not None:
+            # Keywords outside the extracted sections (root type, additionalProperties,
+            # allOf, ...) still constrain the data, so compile from the whole file.
+            with open(source, "rb") as f:
+                document = _json_loads(f.read())
+
+        validator = fastjsonschema.compile(document)
+        self._validators[schema_name] = validator
+        return validator
+
+    def materialize_all(self, schema_name: str) -> Dict[str, Type[BaseModel]]:
+        """
+        Build every model of a schema.
+
+        :param schema_name: Name of the schema
+        :return: Dictionary mapping model names to BaseModel classes, in file order
+        """
+        return {
+            model_name: self.get_model(schema_name, model_name)
+            for model_name in self.model_names(schema_name)
+        }
 
 
 # Global schema registry
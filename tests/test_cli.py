@@ -2,6 +2,8 @@
 
 import json
 import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -9,7 +11,8 @@ from unittest.mock import Mock, patch
 import pytest
 from typer.testing import CliRunner
 
-from nomos.cli import _generate_project_files, app
+from nomos._cli_impl import _generate_project_files
+from nomos.cli import app
 from nomos.config import AgentConfig
 from nomos.models.agent import Step as AgentStep
 
@@ -27,6 +30,48 @@ class TestCLI:
         assert result.exit_code == 0
         # Version should be printed
 
+    def test_version_fast_path(self, capsys, monkeypatch):
+        """Test that --version is answered by the entry point directly."""
+        from nomos import __version__
+        from nomos.__main__ import main
+
+        monkeypatch.setattr(sys, "argv", ["nomos", "--version"])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out.strip() == __version__
+
+    def test_version_fast_path_skips_typer(self):
+        """Test that --version does not import Typer."""
+        code = (
+            "import sys; sys.argv = ['nomos', '--version']\n"
+            "from nomos.__main__ import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('typer' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split()[-1] == "False"
+
+    def test_subcommands_imported_lazily(self):
+        """Test that invoking one command only imports that command's module."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from nomos.cli import app\n"
+            "CliRunner().invoke(app, ['run', '--help'])\n"
+            "print(sorted(m for m in sys.modules if m.startswith('nomos._cli_cmds.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "['nomos._cli_cmds.run']"
+
     def test_help_command(self):
         """Test help command."""
         result = self.runner.invoke(app, ["--help"])
@@ -77,8 +122,8 @@ class TestInitCommand:
         """Set up test environment."""
         self.runner = CliRunner()
 
-    @patch("nomos.cli.Prompt.ask")
-    @patch("nomos.cli.Confirm.ask")
+    @patch("rich.prompt.Prompt.ask")
+    @patch("rich.prompt.Confirm.ask")
     def test_init_basic_template(self, mock_confirm, mock_prompt):
         """Test init command with basic template."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -115,8 +160,8 @@ class TestInitCommand:
             project_dir = Path(temp_dir) / "flagged_agent"
 
             with (
-                patch("nomos.cli.Prompt.ask") as mock_prompt,
-                patch("nomos.cli.Confirm.ask") as mock_confirm,
+                patch("rich.prompt.Prompt.ask") as mock_prompt,
+                patch("rich.prompt.Confirm.ask") as mock_confirm,
             ):
                 mock_prompt.side_effect = [
                     "1",  # LLM choice
@@ -134,7 +179,7 @@ class TestInitCommand:
         with tempfile.TemporaryDirectory() as temp_dir:
             project_dir = Path(temp_dir) / "template_agent"
 
-            with patch("nomos.cli.Prompt.ask") as mock_prompt:
+            with patch("rich.prompt.Prompt.ask") as mock_prompt:
                 mock_prompt.side_effect = [
                     str(project_dir),  # project directory
                     "1",  # LLM choice
@@ -145,8 +190,8 @@ class TestInitCommand:
                 assert result.exit_code == 0
                 assert (project_dir / "config.agent.yaml").exists()
 
-    @patch("nomos.cli._handle_config_generation")
-    @patch("nomos.cli.Prompt.ask")
+    @patch("nomos._cli_impl._handle_config_generation")
+    @patch("rich.prompt.Prompt.ask")
     def test_init_with_generate_flag(self, mock_prompt, mock_generate):
         """Test init command with generate flag."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -169,7 +214,6 @@ class TestInitCommand:
             mock_prompt.side_effect = [
                 str(project_dir),  # project directory
                 "1",  # LLM choice
-                "1",  # LLM choice again (repeated in generate flow)
                 "gpt-4o-mini",  # model choice
                 "Create a test agent",  # usecase
                 "tool1,tool2",  # tools
@@ -190,6 +234,8 @@ class TestInitCommand:
             assert result.exit_code == 0
             assert (project_dir / "config.agent.yaml").exists()
             mock_generate.assert_called_once()
+            assert mock_generate.call_args.kwargs["provider"] == "openai"
+            assert mock_prompt.call_count == 5
 
     def test_init_existing_directory_confirm_no(self):
         """Test init command with existing directory when user says no."""
@@ -199,8 +245,8 @@ class TestInitCommand:
             (project_dir / "existing_file.txt").write_text("test")
 
             with (
-                patch("nomos.cli.Prompt.ask") as mock_prompt,
-                patch("nomos.cli.Confirm.ask") as mock_confirm,
+                patch("rich.prompt.Prompt.ask") as mock_prompt,
+                patch("rich.prompt.Confirm.ask") as mock_confirm,
             ):
                 mock_prompt.return_value = str(project_dir)
                 mock_confirm.return_value = False  # User says no to continue
@@ -215,7 +261,7 @@ class TestInitCommand:
         with tempfile.TemporaryDirectory() as temp_dir:
             project_dir = Path(temp_dir) / "invalid_agent"
 
-            with patch("nomos.cli.Prompt.ask") as mock_prompt:
+            with patch("rich.prompt.Prompt.ask") as mock_prompt:
                 mock_prompt.side_effect = [
                     str(project_dir),
                     "1",  # LLM choice
@@ -278,7 +324,7 @@ llm:
             finally:
                 os.unlink(config_file.name)
 
-    @patch("nomos.cli._run")
+    @patch("nomos._cli_impl._run")
     def test_run_success(self, mock_run):
         """Test successful run command."""
         with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as config_file:
@@ -306,7 +352,7 @@ llm:
             finally:
                 os.unlink(config_file.name)
 
-    @patch("nomos.cli._run")
+    @patch("nomos._cli_impl._run")
     def test_run_keyboard_interrupt(self, mock_run):
         """Test run command with keyboard interrupt."""
         mock_run.side_effect = KeyboardInterrupt()
@@ -351,7 +397,7 @@ class TestServeCommand:
         assert result.exit_code == 1
         assert "Configuration file not found" in result.stdout
 
-    @patch("nomos.cli.run_server")
+    @patch("nomos.server.run_server")
     def test_serve_success(self, mock_run_server):
         """Test successful serve command."""
         with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as config_file:
@@ -401,7 +447,7 @@ class TestTestCommand:
         """Set up test environment."""
         self.runner = CliRunner()
 
-    @patch("nomos.cli._run_tests")
+    @patch("nomos._cli_impl._run_tests")
     def test_test_no_yaml_config(self, mock_run_tests):
         """Test test command without YAML config."""
         result = self.runner.invoke(app, ["test", "--no-coverage"])
@@ -462,6 +508,14 @@ class TestSchemaCommand:
         # Should be valid JSON
         json.loads(output)
 
+    def test_prebuilt_schema_is_current(self):
+        """Test that nomos/_schema.json matches the AgentConfig models."""
+        from nomos._gen_schema import SCHEMA_PATH, render_schema
+
+        assert SCHEMA_PATH.read_bytes() == render_schema(), (
+            "nomos/_schema.json is stale; run `python -m nomos._gen_schema`"
+        )
+
     def test_schema_to_file(self):
         """Test schema command output to file."""
         with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as output_file:
@@ -516,6 +570,23 @@ class TestGenerateProjectFiles:
             assert len(config.steps) == 1
             assert config.steps[0].step_id == "start"
 
+    def test_generated_python_files_are_valid(self):
+        """Test that the generated Python files parse and the README is filled in."""
+        import ast
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target_dir = Path(temp_dir)
+            steps = [AgentStep(step_id="start", description="Start step")]
+
+            _generate_project_files(target_dir, "test_agent", "A persona", "OpenAI", steps)
+
+            for path in ("main.py", "tools/__init__.py", "tools/sample_tool.py"):
+                ast.parse((target_dir / path).read_text())
+            assert "nomos[openai]" in (target_dir / "requirements.txt").read_text()
+            readme = (target_dir / "README.md").read_text()
+            assert readme.startswith("# Test Agent Agent")
+            assert "Persona: A persona" in readme
+
     def test_generate_project_files_no_steps_error(self):
         """Test project file generation with no steps raises error."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -542,7 +613,7 @@ class TestUtilityFunctions:
     @patch("subprocess.run")
     def test_run_tests_success(self, mock_subprocess):
         """Test _run_tests function with success."""
-        from nomos.cli import _run_tests
+        from nomos._cli_impl import _run_tests
 
         mock_subprocess.return_value.returncode = 0
 
@@ -559,7 +630,7 @@ class TestUtilityFunctions:
         """Test _run_tests function with failure."""
         import typer
 
-        from nomos.cli import _run_tests
+        from nomos._cli_impl import _run_tests
 
         mock_subprocess.return_value.returncode = 1
 
@@ -569,27 +640,103 @@ class TestUtilityFunctions:
         # typer.Exit should contain the exit code
         assert exc_info.value.exit_code == 1
 
-    @patch("subprocess.run")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_run_function(self, mock_tempfile, mock_subprocess):
+    @patch("nomos._dev_repl.run_dev_repl")
+    def test_run_function(self, mock_run_dev_repl):
         """Test _run function."""
-        from nomos.cli import _run
-
-        # Mock temporary file
-        mock_temp = Mock()
-        mock_temp.name = "/tmp/test_script.py"
-        mock_tempfile.return_value.__enter__.return_value = mock_temp
-
-        mock_subprocess.return_value.returncode = 0
+        from nomos._cli_impl import _run
 
         config_path = Path("config.yaml")
         tool_files = []
 
-        with patch("os.unlink"), patch("nomos.cli.Path.cwd") as mock_cwd:
+        with patch("nomos._cli_impl.Path.cwd") as mock_cwd:
             mock_cwd.return_value = Path("/test")
             _run(config_path, tool_files, verbose=True)
 
-            mock_subprocess.assert_called_once()
+        mock_run_dev_repl.assert_called_once_with(config_path, True)
+
+    def test_panels_plain_when_not_interactive(self, capsys, monkeypatch):
+        """Test that panels and the banner degrade to plain text outside a terminal."""
+        from nomos._cli_impl import _print_panel, print_banner
+
+        monkeypatch.setattr("nomos._cli_impl._is_interactive", lambda: False)
+        print_banner()
+        _print_panel("body text", title="Some Title")
+
+        output = capsys.readouterr().out
+        assert output == "Some Title\nbody text\n"
+
+    def test_is_interactive_respects_nomos_quiet(self, monkeypatch):
+        """Test that NOMOS_QUIET disables decorative output even on a terminal."""
+        from nomos._cli_impl import _is_interactive
+
+        monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+        monkeypatch.delenv("NOMOS_QUIET", raising=False)
+        assert _is_interactive()
+        monkeypatch.setenv("NOMOS_QUIET", "1")
+        assert not _is_interactive()
+
+    def test_resolve_tool_paths_reports_all_missing(self, tmp_path, capsys):
+        """Test that every missing tool file is reported before exiting."""
+        import typer
+
+        from nomos._cli_impl import _resolve_tool_paths
+
+        existing = tmp_path / "tool.py"
+        existing.write_text("tools = []\n")
+
+        assert _resolve_tool_paths(None) == []
+        assert _resolve_tool_paths([str(existing)]) == [existing]
+        with pytest.raises(typer.Exit):
+            _resolve_tool_paths([str(existing), "missing_a.py", "missing_b.py"])
+
+        output = capsys.readouterr().out
+        assert "missing_a.py" in output
+        assert "missing_b.py" in output
+
+    def test_set_tools_env(self, tmp_path, monkeypatch):
+        """Test TOOLS_PATH construction with and without the default tools directory."""
+        from nomos._cli_impl import _set_tools_env
+
+        (tmp_path / "tools").mkdir()
+        extra = tmp_path / "extra"
+        extra.mkdir()
+        tool_file = extra / "tool.py"
+        tool_file.write_text("tools = []\n")
+        monkeypatch.chdir(tmp_path)
+        # setenv (rather than delenv, which records nothing when the variable is unset)
+        # makes teardown undo whatever the helper writes.
+        monkeypatch.setenv("TOOLS_PATH", "")
+
+        dirs = _set_tools_env([tool_file], include_default=False)
+        assert dirs == {str(extra)}
+        assert os.environ["TOOLS_PATH"] == str(extra)
+
+        dirs = _set_tools_env([tool_file])
+        assert dirs == {str(extra), str(tmp_path / "tools")}
+        assert set(os.environ["TOOLS_PATH"].split(os.pathsep)) == dirs
+
+    @patch("nomos.core.Agent.from_config")
+    def test_run_dev_repl(self, mock_from_config, capsys, tmp_path, monkeypatch):
+        """Test the in-process development loop."""
+        from nomos._dev_repl import run_dev_repl
+        from nomos.models.agent import Action
+
+        config_path = tmp_path / "config.agent.yaml"
+        config_path.write_text(
+            (Path(__file__).parent / "fixtures" / "config.agent.yaml").read_text()
+        )
+        session = mock_from_config.return_value.create_session.return_value
+        session.next.return_value.decision.response = "Goodbye!"
+        session.next.return_value.decision.action = Action.END
+        monkeypatch.chdir(tmp_path)
+
+        with patch("builtins.input", side_effect=["", "hello"]):
+            run_dev_repl(config_path, verbose=False)
+
+        session.next.assert_called_once_with("hello", verbose=False)
+        output = capsys.readouterr().out
+        assert "Agent: Goodbye!" in output
+        assert "Session ended." in output
 
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+"""Tests for the agent configuration cache."""
+
+import os
+import shutil
+from pathlib import Path
+
+from nomos._config_cache import load_agent_config
+
+FIXTURE = Path(__file__).parent / "fixtures" / "config.agent.yaml"
+
+
+def test_load_agent_config_reuses_unchanged_file(tmp_path):
+    """Unchanged files return the cached configuration object."""
+    config_path = tmp_path / "config.agent.yaml"
+    shutil.copy(FIXTURE, config_path)
+
+    first = load_agent_config(config_path)
+    second = load_agent_config(str(config_path))
+
+    assert first is second
+
+
+def test_load_agent_config_reloads_modified_file(tmp_path):
+    """Editing the file invalidates the cached configuration."""
+    config_path = tmp_path / "config.agent.yaml"
+    shutil.copy(FIXTURE, config_path)
+
+    first = load_agent_config(config_path)
+    config_path.write_text(config_path.read_text().replace(first.name, "renamed_agent", 1))
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    second = load_agent_config(config_path)
+
+    assert second is not first
+    assert second.name == "renamed_agent"
+
+
+def test_load_agent_config_reloads_when_referenced_env_changes(tmp_path, monkeypatch):
+    """Values substituted from the environment are part of the cache key."""
+    config_path = tmp_path / "config.agent.yaml"
+    config_path.write_text(FIXTURE.read_text().replace("test_agent", "$NOMOS_TEST_AGENT", 1))
+
+    monkeypatch.setenv("NOMOS_TEST_AGENT", "first_agent")
+    first = load_agent_config(config_path)
+    monkeypatch.setenv("NOMOS_UNRELATED_VAR", "ignored")
+    assert load_agent_config(config_path) is first
+
+    monkeypatch.setenv("NOMOS_TEST_AGENT", "second_agent")
+    second = load_agent_config(config_path)
+
+    assert first.name == "first_agent"
+    assert second.name == "second_agent"
@@ -0,0 +1,538 @@
+"""Tests for loading answer schemas from JSON and Python files."""
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel
+
+from nomos.utils.schema_loader import SchemaRegistry
+
+ADDRESS = {
+    "type": "object",
+    "properties": {
+        "street": {"type": "string"},
+        "city": {"type": "string"},
+    },
+    "required": ["street"],
+}
+
+PERSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "description": "Full name"},
+        "age": {"type": "integer"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "home": ADDRESS,
+        "work": ADDRESS,
+    },
+    "required": ["name"],
+    "definitions": {
+        "Pet": {
+            "type": "object",
+            "properties": {"kind": {"type": "string"}},
+            "required": ["kind"],
+        }
+    },
+}
+
+
+@pytest.fixture
+def registry():
+    return SchemaRegistry()
+
+
+@pytest.fixture
+def person_file(tmp_path):
+    path = tmp_path / "person.json"
+    path.write_text(json.dumps(PERSON_SCHEMA))
+    return path
+
+
+def test_load_json_schema(registry, person_file):
+    """The root, nested object properties and definitions all become models."""
+    models = registry.load_schema("person", str(person_file))
+
+    assert list(models) == ["person", "home", "work", "Pet"]
+    Person = models["person"]
+    assert Person is registry.get_model("person", "person")
+    person = Person(name="Ada", home={"street": "Main St"})
+    assert person.age is None
+    assert person.home.street == "Main St"
+    assert Person.model_fields["name"].description == "Full name"
+    with pytest.raises(ValueError):
+        Person(age=3)
+
+
+def test_load_json_schema_relative_to_base_path(registry, person_file):
+    """Relative schema paths are resolved against the base path."""
+    names = registry.load_schema("person", person_file.name, str(person_file.parent))
+    assert "person" in names
+
+
+def test_load_schemas(registry, person_file):
+    loaded = registry.load_schemas({"person": person_file.name}, str(person_file.parent))
+    assert list(loaded) == ["person"]
+    assert list(loaded["person"]) == ["person", "home", "work", "Pet"]
+
+
+def test_get_model_errors(registry, person_file):
+    registry.load_schema("person", str(person_file))
+
+    with pytest.raises(ValueError, match="Schema 'missing' not found"):
+        registry.get_model("missing", "person")
+    with pytest.raises(ValueError, match="Model 'missing' not found"):
+        registry.get_model("person", "missing")
+
+
+def test_load_schema_errors(registry, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        registry.load_schema("missing", str(tmp_path / "missing.json"))
+
+    unsupported = tmp_path / "schema.yaml"
+    unsupported.write_text("{}")
+    with pytest.raises(ValueError, match="Unsupported schema file type"):
+        registry.load_schema("schema", str(unsupported))
+
+    wrapper = tmp_path / "wrapper.json"
+    wrapper.write_text(json.dumps({"allOf": [{"$ref": "other.json"}]}))
+    with pytest.raises(ValueError, match="has no properties or definitions"):
+        registry.load_schema("wrapper", str(wrapper))
+    assert registry.model_names("wrapper") == []
+
+    for document in (None, 3, ["properties"]):
+        wrapper.write_text(json.dumps(document))
+        with pytest.raises(ValueError, match="has no properties or definitions"):
+            registry.load_schema("wrapper", str(wrapper))
+
+
+def test_large_json_schema_is_streamed(registry, tmp_path, monkeypatch):
+    """Large files are streamed with ijson, skipping unrelated top-level sections."""
+    pytest.importorskip("ijson")
+    monkeypatch.setattr("nomos.utils.schema_loader._STREAM_THRESHOLD", 0)
+    monkeypatch.setenv("NOMOS_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "person.json"
+    path.write_text(json.dumps(dict(PERSON_SCHEMA, paths={"/people": {"get": {}}})))
+
+    models = registry.load_schema("person", str(path))
+
+    assert list(models) == ["person", "home", "work", "Pet"]
+    assert "paths" not in registry._pending["person"]["person"]
+    assert registry.get_model("person", "person")(name="Ada").name == "Ada"
+
+
+def test_large_json_schema_uses_disk_cache(tmp_path, person_file, monkeypatch):
+    """The extracted sections of large files are reused across registries."""
+    monkeypatch.setattr("nomos.utils.schema_loader._STREAM_THRESHOLD", 0)
+    monkeypatch.setenv("NOMOS_CACHE_DIR", str(tmp_path / "cache"))
+
+    SchemaRegistry().load_schema("person", str(person_file))
+    (entry,) = (tmp_path / "cache" / "schemas").glob("*.json")
+    assert json.loads(entry.read_bytes())["sections"]["required"] == ["name"]
+
+    def fail(*args):
+        raise AssertionError("schema file parsed again")
+
+    monkeypatch.setattr("nomos.utils.schema_loader._stream_schema_sections", fail)
+    registry = SchemaRegistry()
+    assert list(registry.load_schema("person", str(person_file))) == [
+        "person",
+        "home",
+        "work",
+        "Pet",
+    ]
+    assert registry.get_model("person", "Pet")(kind="cat").kind == "cat"
+
+
+def test_disk_cache_entry_is_replaced_when_file_changes(tmp_path, person_file, monkeypatch):
+    monkeypatch.setattr("nomos.utils.schema_loader._STREAM_THRESHOLD", 0)
+    monkeypatch.delenv("NOMOS_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    SchemaRegistry().load_schema("person", str(person_file))
+
+    person_file.write_text(json.dumps(dict(PERSON_SCHEMA, required=["name", "age"])))
+    st = person_file.stat()
+    os.utime(person_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    registry = SchemaRegistry()
+    registry.load_schema("person", str(person_file))
+
+    assert registry.get_model("person", "person").model_fields["age"].is_required()
+    (entry,) = (tmp_path / "xdg" / "nomos" / "schemas").glob("*.json")
+    assert json.loads(entry.read_bytes())["sections"]["required"] == ["name", "age"]
+
+
+def test_corrupt_disk_cache_entry_is_a_miss(tmp_path, person_file, monkeypatch):
+    monkeypatch.setattr("nomos.utils.schema_loader._STREAM_THRESHOLD", 0)
+    monkeypatch.setenv("NOMOS_CACHE_DIR", str(tmp_path / "cache"))
+    SchemaRegistry().load_schema("person", str(person_file))
+    (entry,) = (tmp_path / "cache" / "schemas").glob("*.json")
+
+    for garbage in (b"\x80\x04not json", b"[1, 2]"):
+        entry.write_bytes(garbage)
+        registry = SchemaRegistry()
+        assert list(registry.load_schema("person", str(person_file))) == [
+            "person",
+            "home",
+            "work",
+            "Pet",
+        ]
+        # The bad entry is replaced with a good one.
+        assert json.loads(entry.read_bytes())["sections"]["required"] == ["name"]
+
+
+def test_models_are_built_on_first_access(registry, person_file):
+    """Loading only indexes the file; models are built when requested."""
+    registry.load_schema("person", str(person_file))
+
+    assert registry._schemas["person"] == {}
+    Pet = registry.get_model("person", "Pet")
+    assert registry.get_model("person", "Pet") is Pet
+    assert list(registry._schemas["person"]) == ["Pet"]
+    assert registry.model_names("person") == ["person", "home", "work", "Pet"]
+    assert registry.model_names("missing") == []
+
+    # Lookups through the returned mapping are lazy too, and callers get copies of
+    # the name list.
+    registry = SchemaRegistry()
+    models = registry.load_schema("person", str(person_file))
+    assert "Pet" in models and "nope" not in models
+    assert models["home"] is registry.get_model("person", "home")
+    assert list(registry._schemas["person"]) == ["home"]
+    with pytest.raises(KeyError):
+        models["nope"]
+    registry.model_names("person").clear()
+    assert registry.model_names("person") == ["person", "home", "work", "Pet"]
+
+
+def test_nested_models_reuse_the_root_build(registry, person_file, monkeypatch):
+    """Property models built for the root model are not built again on request."""
+    registry.load_schema("person", str(person_file))
+    Person = registry.get_model("person", "person")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("model built twice")
+
+    monkeypatch.setattr("nomos.utils.schema_loader.create_model", fail)
+    assert registry.get_model("person", "home") is Person.model_fields["home"].annotation
+
+
+def test_definition_refs_resolve_to_shared_models(registry, tmp_path):
+    schema = {
+        "type": "object",
+        "properties": {
+            "pet": {"$ref": "#/definitions/Pet"},
+            "pets": {"type": "array", "items": {"$ref": "#/definitions/Pet"}},
+        },
+        "required": ["pet"],
+        "definitions": {
+            "Pet": {
+                "type": "object",
+                "properties": {
+                    "kind": {"type": "string"},
+                    "owner": {"$ref": "#/definitions/Owner"},
+                },
+            },
+            "Owner": {"type": "object", "properties": {"name": {"type": "string"}}},
+        },
+    }
+    path = tmp_path / "owner.json"
+    path.write_text(json.dumps(schema))
+    registry.load_schema("owner", str(path))
+
+    model = registry.get_model("owner", "owner")
+    pet_model = registry.get_model("owner", "Pet")
+    assert model.model_fields["pet"].annotation is pet_model
+    assert model.model_fields["pets"].annotation == List[pet_model]
+    owner_model = registry.get_model("owner", "Owner")
+    assert pet_model.model_fields["owner"].annotation is owner_model
+
+    instance = model(pet={"kind": "cat", "owner": {"name": "Ann"}}, pets=[{"kind": "dog"}])
+    assert isinstance(instance.pet, pet_model)
+    assert instance.pet.owner.name == "Ann"
+
+
+def test_identical_definitions_share_a_model_when_built_through_refs(registry, tmp_path):
+    leaf = {"type": "object", "properties": {"x": {"type": "integer"}}}
+    schema = {
+        "type": "object",
+        "properties": {"a": {"$ref": "#/definitions/A"}, "b": {"$ref": "#/definitions/B"}},
+        "definitions": {"A": leaf, "B": dict(leaf)},
+    }
+    path = tmp_path / "pair.json"
+    path.write_text(json.dumps(schema))
+    registry.load_schema("pair", str(path))
+
+    model = registry.get_model("pair", "pair")
+    assert model.model_fields["a"].annotation is model.model_fields["b"].annotation
+    assert registry.get_model("pair", "A") is registry.get_model("pair", "B")
+
+
+def test_refs_to_non_object_definitions_resolve_to_their_type(registry, tmp_path):
+    """Only object definitions with properties become models; other refs keep their type."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "color": {"$ref": "#/definitions/Color"},
+            "tags": {"$ref": "#/definitions/Tags"},
+            "pets": {"$ref": "#/definitions/Pets"},
+            "meta": {"$ref": "#/definitions/Meta"},
+        },
+        "definitions": {
+            "Color": {"type": "string", "enum": ["red", "green"]},
+            "Tags": {"type": "array", "items": {"type": "string"}},
+            "Pets": {"type": "array", "items": {"$ref": "#/definitions/Pet"}},
+            "Pet": {"type": "object", "properties": {"kind": {"type": "string"}}},
+            "Meta": {"type": "object", "additionalProperties": {"type": "string"}},
+        },
+    }
+    path = tmp_path / "mixed.json"
+    path.write_text(json.dumps(schema))
+    registry.load_schema("mixed", str(path))
+
+    model = registry.get_model("mixed", "mixed")
+    pet_model = registry.get_model("mixed", "Pet")
+    assert model.model_fields["color"].annotation is str
+    assert model.model_fields["tags"].annotation == List[str]
+    assert model.model_fields["pets"].annotation == List[pet_model]
+    assert model.model_fields["meta"].annotation == Dict[str, Any]
+
+    instance = model(color="red", tags=["a"], pets=[{"kind": "cat"}], meta={"k": "v"})
+    assert instance.color == "red"
+    assert instance.tags == ["a"]
+    assert isinstance(instance.pets[0], pet_model)
+    assert instance.meta == {"k": "v"}
+    assert set(registry._schemas["mixed"]) == {"mixed", "Pet"}
+
+
+def test_cyclic_definition_refs_fall_back_to_any(registry, tmp_path):
+    schema = {
+        "type": "object",
+        "properties": {"root": {"$ref": "#/definitions/Node"}},
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "integer"},
+                    "next": {"$ref": "#/definitions/Node"},
+                },
+            }
+        },
+    }
+    path = tmp_path / "tree.json"
+    path.write_text(json.dumps(schema))
+    registry.load_schema("tree", str(path))
+
+    node_model = registry.get_model("tree", "Node")
+    assert registry.get_model("tree", "tree").model_fields["root"].annotation is node_model
+    assert node_model.model_fields["next"].annotation is Any
+
+
+def test_concurrent_get_model_builds_once(registry, person_file, monkeypatch):
+    """Threads racing on a cold model share a single build."""
+    from nomos.utils import schema_loader
+
+    registry.load_schema("person", str(person_file))
+    builds = []
+    real_create_model = schema_loader.create_model
+
+    def slow_create_model(*args, **kwargs):
+        builds.append(args[0])
+        time.sleep(0.05)
+        return real_create_model(*args, **kwargs)
+
+    monkeypatch.setattr(schema_loader, "create_model", slow_create_model)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get_model("person", "Pet")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert len(set(results)) == 1
+
+
+def test_model_locks_are_dropped_once_built(registry, person_file):
+    registry.load_schema("person", str(person_file))
+    registry.materialize_all("person")
+
+    assert [key for key in registry._locks if key[0] == "model"] == []
+
+
+def test_model_names_are_derived_from_shape(person_file):
+    """Generated class names are stable across registries and differ per shape."""
+    first, second = SchemaRegistry(), SchemaRegistry()
+    for registry in (first, second):
+        registry.load_schema("person", str(person_file))
+
+    Person = first.get_model("person", "person")
+    assert Person.__name__.startswith("M_")
+    assert Person.__name__ == second.get_model("person", "person").__name__
+    assert Person.__name__ != first.get_model("person", "Pet").__name__
+
+
+def test_identical_subschemas_share_a_model(registry, person_file):
+    """Structurally identical object schemas are compiled once."""
+    registry.load_schema("person", str(person_file))
+    models = registry.materialize_all("person")
+
+    assert models["home"] is models["work"]
+    assert models["person"].model_fields["home"].annotation is models["home"]
+
+
+def test_reloading_unchanged_file_reuses_models(registry, person_file):
+    registry.load_schema("person", str(person_file))
+    first = registry.get_model("person", "person")
+    registry.load_schema("person", str(person_file))
+
+    assert registry.get_model("person", "person") is first
+
+
+def test_reloading_modified_file_rebuilds_models(registry, person_file):
+    registry.load_schema("person", str(person_file))
+    first = registry.get_model("person", "person")
+
+    schema = dict(PERSON_SCHEMA, required=["name", "age"])
+    person_file.write_text(json.dumps(schema))
+    st = person_file.stat()
+    os.utime(person_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    registry.load_schema("person", str(person_file))
+
+    second = registry.get_model("person", "person")
+    assert second is not first
+    assert second.model_fields["age"].is_required()
+    # The parsed file is replaced, not kept alongside the old version.
+    assert len(registry._file_cache) == 1
+
+
+def test_get_validator(registry, person_file, tmp_path):
+    """JSON schemas can be validated without building Pydantic models."""
+    fastjsonschema = pytest.importorskip("fastjsonschema")
+    registry.load_schema("person", str(person_file))
+
+    validate = registry.get_validator("person")
+    assert registry.get_validator("person") is validate
+    assert validate({"name": "Ada", "age": 36}) == {"name": "Ada", "age": 36}
+    with pytest.raises(fastjsonschema.JsonSchemaValueException):
+        validate({"age": "old"})
+    assert registry._schemas["person"] == {}
+
+    path = tmp_path / "models.py"
+    path.write_text("from pydantic import BaseModel\n\nclass Answer(BaseModel):\n    text: str\n")
+    registry.load_schema("answers", str(path))
+    with pytest.raises(ValueError, match="not loaded from a JSON file"):
+        registry.get_validator("answers")
+    with pytest.raises(ValueError, match="not found"):
+        registry.get_validator("missing")
+
+
+def test_get_validator_for_large_schema_uses_whole_document(registry, tmp_path, monkeypatch):
+    """Validators of streamed files still honour keywords outside the model sections."""
+    pytest.importorskip("fastjsonschema")
+    monkeypatch.setattr("nomos.utils.schema_loader._STREAM_THRESHOLD", 0)
+    monkeypatch.setenv("NOMOS_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "strict.json"
+    path.write_text(
+        json.dumps(
+            {
+                "type": "object",
+                "properties": {"a": {"type": "string"}},
+                "additionalProperties": False,
+            }
+        )
+    )
+    registry.load_schema("strict", str(path))
+
+    validate = registry.get_validator("strict")
+    assert validate({"a": "x"}) == {"a": "x"}
+    for invalid in ({"a": "x", "extra": 1}, [1]):
+        with pytest.raises(ValueError):
+            validate(invalid)
+
+
+def test_get_validator_without_fastjsonschema(registry, person_file, monkeypatch):
+    monkeypatch.setitem(sys.modules, "fastjsonschema", None)
+    registry.load_schema("person", str(person_file))
+    with pytest.raises(ImportError, match=r"pip install nomos\[schemas\]"):
+        registry.get_validator("person")
+
+
+def test_load_python_schema(registry, tmp_path):
+    path = tmp_path / "models.py"
+    path.write_text(
+        "from pydantic import BaseModel\n\n"
+        "class Answer(BaseModel):\n"
+        "    text: str\n\n"
+        "NOT_A_MODEL = 1\n"
+    )
+
+    models = registry.load_schema("answers", str(path))
+
+    assert list(models) == ["Answer"]
+    assert models["Answer"] is registry.get_model("answers", "Answer")
+    assert issubclass(models["Answer"], BaseModel)
+
+
+def test_python_schema_models_in_definition_order(registry, tmp_path):
+    path = tmp_path / "models.py"
+    path.write_text(
+        "from pydantic import BaseModel\n\n"
+        "class Zebra(BaseModel):\n"
+        "    stripes: int\n\n"
+        "class Antelope(BaseModel):\n"
+        "    horns: int\n"
+    )
+
+    assert list(registry.load_schema("animals", str(path))) == ["Zebra", "Antelope"]
+
+
+def test_python_schema_is_imported_once(registry, tmp_path):
+    """Unchanged Python schema files are not re-executed."""
+    path = tmp_path / "models.py"
+    path.write_text("from pydantic import BaseModel\n\nclass Answer(BaseModel):\n    text: str\n")
+
+    registry.load_schema("answers", str(path))
+    first = registry.get_model("answers", "Answer")
+    registry.load_schema("answers", str(path))
+    assert registry.get_model("answers", "Answer") is first
+
+    path.write_text(path.read_text() + "    score: int = 0\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    registry.load_schema("answers", str(path))
+    assert "score" in registry.get_model("answers", "Answer").model_fields
+
+
+def test_step_answer_model_from_schema_reference(person_file):
+    """Step.get_answer_model resolves schema references through the registry."""
+    from nomos.models.agent import Step
+    from nomos.utils.schema_loader import schema_registry
+
+    schema_registry.load_schema("person", str(person_file))
+    step = Step(step_id="ask", description="Ask", answer_model="person")
+    assert step.get_answer_model() is schema_registry.get_model("person", "person")
+
+    step = Step(step_id="ask", description="Ask", answer_model="person.Pet")
+    assert step.get_answer_model() is schema_registry.get_model("person", "Pet")
+
+
+def test_json_type_to_python(registry):
+    assert registry._json_type_to_python({"type": "number"}) is float
+    assert registry._json_type_to_python({"type": "boolean"}) is bool
+    assert registry._json_type_to_python({"type": "object"}) == Dict[str, Any]
+    assert registry._json_type_to_python({"type": "array"}) == List[Any]
+    assert registry._json_type_to_python({"type": ["string", "null"]}) is Any
+    assert registry._json_type_to_python({}) is Any
+
+
+def test_list_aliases_are_reused(registry):
+    strings = {"type": "array", "items": {"type": "string"}}
+    assert registry._json_type_to_python(strings) == List[str]
+    assert registry._json_type_to_python(strings) is registry._json_type_to_python(dict(strings))